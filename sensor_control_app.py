@@ -17,19 +17,22 @@ The modular version provides:
 """
 
 import warnings
+import bisect
+import collections
+import hashlib
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext, filedialog
+from tkinter import ttk, messagebox, scrolledtext
 import psutil
 import json
-from datetime import datetime
-from collections import defaultdict, deque
+from functools import lru_cache, partial
 import re
 import threading
 import time
-import csv
-from scapy.all import Ether, Raw, sendp
+import queue
+import socket
+import ctypes
+import ctypes.util
 import os
-import json
 import math
 
 # Show deprecation warning
@@ -79,6 +82,203 @@ appendix_dict = {
     "X_E3_FanSpeed1_High": b"\xe3",
 }
 db_json = "db.json"
+# Log incremental de registros de MC: una línea JSON por registro, en vez de
+# reescribir el snapshot completo en cada alta
+db_json_log = db_json + ".log"
+
+# Patrón de MAC compilado una sola vez (soporta : y - como separadores)
+_MAC_RE = re.compile(r"^([0-9a-f]{2}[:-]){5}[0-9a-f]{2}$")
+
+# Cola fija de la cabecera de trama: largo (7) + padding + constantes
+_FRAME_HEADER_TAIL = (7).to_bytes(2, byteorder="big") + b"\x00\x00\x00\x00" + b"\x02\x03"
+
+# Conjuntos de comandos especiales, definidos una sola vez a nivel de módulo:
+# frozenset da membership O(1) y evita recrear las listas en cada callback
+_AUTO_COMMANDS = frozenset({"X_FF_Reset", "X_02_TestTrigger", "X_03_RO_Single"})
+_REPEATABLE_COMMANDS = frozenset({"X_02_TestTrigger", "X_03_RO_Single"})
+
+# Definición de comandos con sus appendix. Es una tabla fija: se construye
+# una sola vez al importar el módulo en vez de en cada create_commands_tab
+_COMMAND_CONFIGS = {
+    "X_02_TestTrigger": {"ON": "X_02_TestTrigger"},
+    "X_03_RO_Single": {"ON": "X_03_RO_Single"},
+    "X_04_RO_ON | X_05_RO_OFF": {"ON": "X_04_RO_ON", "OFF": "X_05_RO_OFF"},
+    "X_08_DIAG_ | X_09_DIAG_DIS": {"ON": "X_08_DIAG_", "OFF": "X_09_DIAG_DIS"},
+    "X_FB_TTrig_Auto_EN | X_FC_TTrig_Auto_DIS": {
+        "ON": "X_FB_TTrig_Auto_EN",
+        "OFF": "X_FC_TTrig_Auto_DIS",
+    },
+    "X_FF_Reset": {"ON": "X_FF_Reset"},
+    "X_20_PwrDwnb_TOP_ON | X_21_PwrDwnb_TOP_OFF": {"ON": "X_20_PwrDwnb_TOP_ON", "OFF": "X_21_PwrDwnb_TOP_OFF"},
+    "X_22_PwrDwnb_BOT_ON | X_23_PwrDwnb_BOT_OFF": {
+        "ON": "X_22_PwrDwnb_BOT_ON",
+        "OFF": "X_23_PwrDwnb_BOT_OFF",
+    },
+    "X_26_PwrEN_2V4D_ON | X_27_PwrEN_2V4D_OFF": {"ON": "X_26_PwrEN_2V4D_ON", "OFF": "X_27_PwrEN_2V4D_OFF"},
+    "X_28_PwrEN_3V1_ON | X_29_PwrEN_3V1_OFF": {"ON": "X_28_PwrEN_3V1_ON", "OFF": "X_29_PwrEN_3V1_OFF"},
+    "X_2A_PwrEN_1V8A_ON | X_2B_PwrEN_1V8A_OFF": {"ON": "X_2A_PwrEN_1V8A_ON", "OFF": "X_2B_PwrEN_1V8A_OFF"},
+    "X_E1_FanSpeed0_High | X_E0_FanSpeed0_Low": {
+        "HIGH": "X_E1_FanSpeed0_High", "LOW": "X_E0_FanSpeed0_Low"
+    },
+    "X_F9_TTrig_Global | X_FA_TTrig_Local": {"GLOBAL": "X_F9_TTrig_Global", "LOCAL": "X_FA_TTrig_Local"},
+    "X_E3_FanSpeed1_High | X_E2_FanSpeed1_Low": {"HIGH": "X_E3_FanSpeed1_High", "LOW": "X_E2_FanSpeed1_Low"},
+}
+
+
+class _CmdRowState:
+    """Estado en memoria de una fila de la tabla de comandos
+
+    __slots__ evita asignar un dict por fila en cada rebuild y hace que los
+    accesos desde los callbacks y el loop de envío sean cargas de slot en
+    vez de búsquedas por key.
+    """
+    __slots__ = ("state", "checkbox", "repetitions", "on_btn", "off_btn", "delta_time")
+
+    def __init__(self, state=None):
+        self.state = state
+        self.checkbox = None
+        self.repetitions = None
+        self.on_btn = None
+        self.off_btn = None
+        self.delta_time = None
+
+# Posiciones unitarias del anillo de 10 PETs (empezando arriba, sentido
+# horario): calculadas una sola vez al importar en vez de en cada build
+_PET_RING = tuple(
+    (math.cos(2 * math.pi * i / 10 - math.pi / 2),
+     math.sin(2 * math.pi * i / 10 - math.pi / 2))
+    for i in range(10)
+)
+
+# Máximo de líneas retenidas en el área de respuestas: sin tope, el layout
+# del widget Text se degrada linealmente con el largo de la sesión
+_MAX_LOG_LINES = 2000
+
+
+# Serialización de db.json: orjson es varias veces más rápido que el módulo
+# estándar y produce bytes directamente; si no está instalado, usar json.
+# Salida compacta (sin indentación): db.json solo lo lee el programa y el
+# pretty-print multiplica tanto el trabajo del encoder como los bytes a disco
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        # OPT_NON_STR_KEYS: pet_associations se indexa por int (1-10) y
+        # orjson rechaza keys no-str por defecto (json las convierte solo)
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+def write_db_payload(path, payload):
+    """Escribe bytes ya serializados en disco de forma atómica
+
+    Se escribe a un archivo temporal, se hace un único fsync y recién entonces
+    se reemplaza el archivo real; un corte a mitad de escritura nunca deja
+    db.json corrupto ni vacío.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def write_db_file(path, data):
+    """Serializa y escribe el contenido de la base en disco de forma atómica"""
+    write_db_payload(path, _json_dumps(data))
+
+
+@lru_cache(maxsize=256)
+def mac_to_bytes(mac):
+    """Convierte una MAC 'aa:bb:cc:dd:ee:ff' a su forma canónica de 6 bytes
+
+    Memoizada: las mismas MACs se convierten una y otra vez al refrescar
+    tablas y combobox, y el conjunto de MACs vistas es pequeño.
+    """
+    return bytes.fromhex(mac.replace(":", ""))
+
+
+def bytes_to_mac(mac_bytes):
+    """Convierte una MAC de 6 bytes a su representación 'aa:bb:cc:dd:ee:ff'"""
+    return ":".join(f"{byte:02x}" for byte in mac_bytes)
+
+
+# Estructuras para sendmmsg(2): permite entregar varias tramas al kernel
+# en una sola llamada al sistema cuando se envía una ráfaga sin delay
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    _sendmmsg = _libc.sendmmsg
+except (OSError, AttributeError, TypeError):
+    _sendmmsg = None
+
+
+def send_frames_batch(sock, frames):
+    """Envía una lista de tramas en una sola llamada al sistema con sendmmsg
+
+    Si la libc no expone sendmmsg, cae de vuelta a un send() por trama.
+    Retorna la cantidad de tramas enviadas.
+    """
+    if _sendmmsg is None:
+        for frame in frames:
+            sock.send(frame)
+        return len(frames)
+
+    buffers = [ctypes.create_string_buffer(frame, len(frame)) for frame in frames]
+    iovecs = (_IOVec * len(frames))()
+    msgs = (_MMsgHdr * len(frames))()
+    for i, buf in enumerate(buffers):
+        iovecs[i].iov_base = ctypes.cast(buf, ctypes.c_void_p)
+        iovecs[i].iov_len = len(frames[i])
+        msgs[i].msg_hdr.msg_iov = ctypes.pointer(iovecs[i])
+        msgs[i].msg_hdr.msg_iovlen = 1
+
+    # sendmmsg puede entregar menos mensajes de los pedidos (p. ej. buffer de
+    # socket lleno): reintentar desde el offset hasta agotar la lista
+    total = 0
+    while total < len(frames):
+        sent = _sendmmsg(
+            sock.fileno(),
+            ctypes.byref(msgs, total * ctypes.sizeof(_MMsgHdr)),
+            len(frames) - total,
+            0,
+        )
+        if sent < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        if sent == 0:
+            # Sin progreso: terminar el resto con un send() por trama
+            for frame in frames[total:]:
+                sock.send(frame)
+            return len(frames)
+        total += sent
+    return total
 
 
 class McControlApp:
@@ -107,10 +307,36 @@ class McControlApp:
         self.mc_available = {}  # keys: mac_source, values: interfaces
         self.mc_registered = (
             {}
-        )  # keys: mac_source, values: dict {  mac_destiny, interface_destiny, label, last_state{} }
+        )  # keys: mac_source como bytes (6 bytes), values: dict {  mac_destiny, interface_destiny, label, last_state{} }
+        # Índice inverso mac_destiny -> key de mc_registered, para resolver el
+        # MC seleccionado en O(1) en vez de recorrer todos los registrados
+        self._by_mac_dst = {}
         self.frames_sent = 0
         self.frames_received = 0
 
+        # Caches para el envío rápido: cabecera de trama fija por MC y socket raw por interfaz
+        self.frame_prefix_cache = {}  # keys: mac_source como bytes, values: cabecera precalculada
+        self.frame_cache = {}  # keys: mac_source como bytes, values: {comando: trama completa}
+        self.l2_sockets = {}  # keys: nombre de interfaz, values: socket AF_PACKET
+
+        # Cache de la lista formateada de MCs para los combobox, junto con
+        # el mapa mac_destino -> texto mostrado para selección directa
+        self._mc_display_cache = None
+        self._mc_display_by_mac = {}
+
+        # Cache con TTL de la consulta de interfaces a psutil:
+        # (timestamp, net_if_addrs, net_if_stats)
+        self._netif_cache = (0.0, None, None)
+
+        # Bitmap de comandos habilitados: un bit por fila en vez de un
+        # tk.BooleanVar (variable Tcl completa) por fila
+        self._enabled_bits = bytearray()
+        self._cmd_bit_index = {}
+
+        # MCs con entradas nuevas o reemplazadas pendientes de sincronizar
+        # con self.db antes del próximo guardado
+        self._dirty_macs = set()
+
         # Estado de asociaciones PET
         self.pet_associations = {}  # {pet_num: {"mc": mac_destiny, "enabled": boolean}}
         for i in range(1, 11):
@@ -119,15 +345,48 @@ class McControlApp:
         # Macros universales (compartidas entre todos los MCs)
         self.macros = {}
 
+        # Cola de mensajes pendientes para el área de respuestas: los envíos
+        # en ráfaga encolan aquí y un único tick de after() los vuelca juntos
+        self._log_queue = collections.deque()
+
+        # Timestamp formateado del segundo actual: en ráfagas de respuestas
+        # dentro del mismo segundo se reutiliza sin volver a formatear
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
+
+        # Guardado pendiente de db.json: update_db_stats solo marca el flag y
+        # un tick de after() hace la escritura real
+        self._db_dirty = False
+
+        # Handle persistente (append) del log incremental de registros
+        self._mc_log_fp = None
+
+        # Hash del último payload escrito: si el estado serializado no cambió
+        # (p.ej. un registro repetido), se evita la escritura completa
+        self._last_db_hash = None
+
+        # Thread escritor de db.json: recibe payloads ya serializados y hace
+        # la parte lenta (write + fsync + replace) fuera del thread de la UI
+        self._write_queue = queue.Queue()
+        self._db_writer_thread = threading.Thread(target=self._db_writer_loop, daemon=True)
+        self._db_writer_thread.start()
+
         self.init_database()
 
         self.create_main_interface()
 
+        self.root.after(50, self._drain_log)
+        self.root.after(500, self._flush_db_if_dirty)
+
     def setup_drag_and_drop(self, row_frame, cmd_name):
         """Configura drag and drop para una fila de comando"""
         self.dragging = False
         self.drag_source = None
         self.drag_placeholder = None
+        self._row_extents = []
+        self._row_tops = []
+        self._last_hover_frame = None
+        self._motion_pending = False
 
         # Bind events solo al frame de la fila (no a botones ni checkboxes)
         row_frame.bind("<Enter>", lambda e: row_frame.config(cursor="hand1"))
@@ -147,6 +406,19 @@ class McControlApp:
         self.drag_source = (row_frame, cmd_name)
         self.drag_start_y = event.y_root
 
+        # Precalcular los límites verticales de cada fila: evita las llamadas
+        # winfo_* (ida y vuelta a Tcl por fila) en cada evento de movimiento.
+        # Las filas están apiladas de arriba a abajo, así que los topes quedan
+        # ordenados y la fila bajo el cursor se ubica con búsqueda binaria
+        self._row_extents = []
+        for frame_data in self.command_rows:
+            frame = frame_data["frame"]
+            top = frame.winfo_rooty()
+            self._row_extents.append((top, top + frame.winfo_height(), frame))
+        self._row_tops = [top for top, _bottom, _frame in self._row_extents]
+        self._last_hover_frame = None
+        self._motion_pending = False
+
         # Cambiar apariencia de la fila que se está arrastrando
         row_frame.config(relief="raised", borderwidth=3, bg="#e3f2fd")
 
@@ -155,20 +427,36 @@ class McControlApp:
         if not self.dragging:
             return
 
-        # Calcular sobre qué fila está el cursor
-        for frame_data in self.command_rows:
-            frame = frame_data["frame"]
-            frame_y = frame.winfo_rooty()
-            frame_height = frame.winfo_height()
+        # Coalescer los eventos de movimiento: procesar a lo más uno por
+        # ciclo idle del loop de eventos en vez de uno por pixel recorrido
+        if self._motion_pending:
+            return
+        self._motion_pending = True
+        y_root = event.y_root
+        self.root.after_idle(lambda: self._do_drag_update(y_root, row_frame))
 
-            if frame_y <= event.y_root <= frame_y + frame_height:
-                # Resaltar la fila sobre la que está
-                if frame != row_frame:
-                    frame.config(bg="#fff3e0")
-            else:
-                # Restaurar color original
-                if frame != row_frame:
-                    frame.config(bg="white")
+    def _do_drag_update(self, y_root, row_frame):
+        """Actualiza el resaltado de la fila bajo el cursor durante el arrastre"""
+        self._motion_pending = False
+        if not self.dragging:
+            return
+
+        # Buscar la fila bajo el cursor: bisect sobre los topes ordenados
+        # en vez de recorrer todas las filas (O(log n) por movimiento)
+        hover_frame = None
+        idx = bisect.bisect_right(self._row_tops, y_root) - 1
+        if idx >= 0 and y_root <= self._row_extents[idx][1]:
+            hover_frame = self._row_extents[idx][2]
+
+        if hover_frame is self._last_hover_frame:
+            return
+
+        # Repintar solo las filas cuyo color realmente cambia
+        if self._last_hover_frame is not None and self._last_hover_frame is not row_frame:
+            self._last_hover_frame.config(bg="white")
+        if hover_frame is not None and hover_frame is not row_frame:
+            hover_frame.config(bg="#fff3e0")
+        self._last_hover_frame = hover_frame
 
     def end_drag(self, event, row_frame):
         """Finaliza el arrastre y reordena"""
@@ -177,24 +465,20 @@ class McControlApp:
 
         self.dragging = False
 
-        # Restaurar apariencia
+        # Restaurar apariencia: solo la fila arrastrada y la resaltada
+        # pueden tener otro color, no hace falta repintar toda la tabla
         row_frame.config(relief="ridge", borderwidth=1, bg="white")
+        if self._last_hover_frame is not None and self._last_hover_frame is not row_frame:
+            self._last_hover_frame.config(bg="white")
+        self._last_hover_frame = None
 
-        # Encontrar sobre qué fila se soltó
+        # Encontrar sobre qué fila se soltó usando los límites cacheados
+        # en start_drag, con la misma búsqueda binaria del movimiento
         target_row = None
-        target_index = None
-
-        for i, frame_data in enumerate(self.command_rows):
-            frame = frame_data["frame"]
-            frame.config(bg="white")  # Restaurar todos
-
-            frame_y = frame.winfo_rooty()
-            frame_height = frame.winfo_height()
-
-            if frame_y <= event.y_root <= frame_y + frame_height:
-                target_row = frame_data
-                target_index = i
-                break
+        idx = bisect.bisect_right(self._row_tops, event.y_root) - 1
+        if (idx >= 0 and idx < len(self.command_rows)
+                and event.y_root <= self._row_extents[idx][1]):
+            target_row = self.command_rows[idx]
 
         # Si se soltó sobre otra fila, reordenar
         if target_row and target_row["cmd_name"] != self.drag_source[1]:
@@ -208,11 +492,7 @@ class McControlApp:
         selected_mc = self.get_mac_from_selection(selected_mc_display) if selected_mc_display else None
 
         # Buscar el MC seleccionado
-        mc_data = None
-        for data in self.mc_registered.values():
-            if data.get("mac_destiny") == selected_mc:
-                mc_data = data
-                break
+        _, mc_data = self._lookup_mc(selected_mc)
 
         if not mc_data:
             return
@@ -232,11 +512,12 @@ class McControlApp:
         item = self.command_rows.pop(source_idx)
         self.command_rows.insert(target_idx, item)
 
-        # Reordenar también en el MC específico
-        configs_list = list(mc_data["command_configs"].items())
-        config_item = configs_list.pop(source_idx)
-        configs_list.insert(target_idx, config_item)
-        mc_data["command_configs"] = dict(configs_list)
+        # Reordenar también en el MC específico sin la lista intermedia de
+        # tuplas: armar el nuevo orden de keys y el dict en una sola pasada
+        configs = mc_data["command_configs"]
+        new_order = [k for k in configs if k != source_cmd]
+        new_order.insert(target_idx, source_cmd)
+        mc_data["command_configs"] = {k: configs[k] for k in new_order}
 
         # Actualizar la UI
         self.rebuild_command_table()
@@ -244,239 +525,315 @@ class McControlApp:
             f"✓ Orden actualizado: {source_cmd} movido a posición de {target_cmd}"
         )
 
-    def rebuild_command_table(self):
-        """Reconstruye la tabla de comandos con el nuevo orden y carga last_state según MC seleccionado"""
-        # Guardar estado actual de comandos antes de destruir filas
-        prev_states = {}
-        for cmd_name, cmd_state in self.commands_state.items():
-            prev_states[cmd_name] = {
-                "enabled": cmd_state["enabled"].get() if "enabled" in cmd_state else False,
-                "state": cmd_state.get("state"),
-            }
+    def _toggle_enabled_bit(self, cmd_name):
+        """Invierte el bit de habilitado de un comando (callback del checkbox)"""
+        idx = self._cmd_bit_index[cmd_name]
+        self._enabled_bits[idx // 8] ^= 1 << (idx % 8)
+
+    def _cmd_enabled(self, cmd_name):
+        """Lee el bit de habilitado de un comando desde el bitmap"""
+        idx = self._cmd_bit_index.get(cmd_name)
+        if idx is None:
+            return False
+        return bool(self._enabled_bits[idx // 8] & (1 << (idx % 8)))
+
+    def _set_cmd_enabled(self, cmd_name, value):
+        """Fija el bit de habilitado y sincroniza el checkbox correspondiente"""
+        idx = self._cmd_bit_index.get(cmd_name)
+        if idx is None:
+            return
+        if value:
+            self._enabled_bits[idx // 8] |= 1 << (idx % 8)
+        else:
+            self._enabled_bits[idx // 8] &= ~(1 << (idx % 8))
+
+        cmd_state = self.commands_state.get(cmd_name)
+        checkbox = cmd_state.checkbox if cmd_state else None
+        if checkbox is not None:
+            if value:
+                checkbox.select()
+            else:
+                checkbox.deselect()
 
-        # Destruir todas las filas actuales
-        for row_data in self.command_rows:
-            row_data["frame"].destroy()
-        self.command_rows.clear()
+    def rebuild_command_table(self):
+        """Reconstruye la tabla de comandos con el nuevo orden y carga last_state según MC seleccionado
 
+        En vez de destruir y recrear todas las filas, calcula la diferencia
+        contra las filas existentes: destruye solo las que sobran, crea solo
+        las nuevas y reordena el resto con pack_forget()/pack(), recargando
+        el estado guardado en las filas que se reutilizan.
+        """
         # Obtener el MC destino seleccionado
         selected_mc_display = self.mc_var.get()
         selected_mc = self.get_mac_from_selection(selected_mc_display) if selected_mc_display else None
 
         # Buscar el MC seleccionado y su orden de comandos
-        mc_data = None
-        for data in self.mc_registered.values():
-            if data.get("mac_destiny") == selected_mc:
-                mc_data = data
-                break
+        _, mc_data = self._lookup_mc(selected_mc)
 
         # Solo usar los comandos del MC, si no tiene, tabla vacía
         command_configs = mc_data.get("command_configs", {}) if mc_data else {}
         last_state = mc_data.get("last_state", {}) if mc_data else {}
 
-        # Limpiar tabla
-        for row_data in self.command_rows:
-            row_data["frame"].destroy()
-        self.command_rows.clear()
+        # Orden deseado: solo los comandos con estado definido
+        desired = [cmd for cmd in command_configs if cmd in last_state]
+        current = {row["cmd_name"]: row for row in self.command_rows}
 
-        # Si no hay comandos, no mostrar filas
-        if not command_configs:
-            return
-
-        # Comandos que necesitan columna de repeticiones
-        repeatable_commands = ["X_02_TestTrigger", "X_03_RO_Single"]
-        # Comandos que NO tienen botones (automáticos al marcar checkbox)
-        auto_commands = ["X_FF_Reset", "X_02_TestTrigger", "X_03_RO_Single"]
+        # Destruir solo las filas que ya no corresponden
+        for cmd_name in set(current) - set(desired):
+            row = current.pop(cmd_name)
+            row["frame"].destroy()
+            self.commands_state.pop(cmd_name, None)
 
-        # Recrear filas en el nuevo orden
-        for idx, (cmd_name, cmd_config) in enumerate(command_configs.items()):
-            if cmd_name not in last_state:
-                continue 
+        # Reiniciar el bitmap de habilitados: un bit por fila deseada
+        self._cmd_bit_index = {}
+        self._enabled_bits = bytearray((len(desired) + 7) // 8)
 
-            bg_color = "#f7f7f7"
-            row_frame = tk.Frame(self.commands_table_frame, relief="ridge", borderwidth=1, bg=bg_color, height=35)
-            row_frame.pack(fill="x")
-            row_frame.pack_propagate(False)
-            row_frame.grid_propagate(False)
+        # Comandos que NO tienen botones (automáticos al marcar checkbox)
 
-            # Configurar el grid para centrar verticalmente
-            row_frame.grid_rowconfigure(0, weight=1)
+        self.command_rows = []
+        for cmd_name in desired:
+            cmd_config = command_configs[cmd_name]
+            row = current.get(cmd_name)
+            if row is None:
+                row = self._build_command_row(cmd_name, cmd_config, last_state)
+            else:
+                self._refresh_command_row(cmd_name, cmd_config, last_state)
 
-            # Restaurar estado si existe, sino inicializar
+            # Registrar el bit de habilitado de esta fila en el bitmap
+            base_cmd = cmd_name.partition('#')[0]
             state_val = last_state.get(cmd_name, None)
-            enabled_val = bool(state_val)
-            
-            # Extraer comando base para verificar tipo
-            base_cmd = cmd_name.split('#')[0] if '#' in cmd_name else cmd_name
-
-            # Para comandos automáticos, el checkbox debe estar marcado si state_val == "ON"
-            if base_cmd in auto_commands:
+            if base_cmd in _AUTO_COMMANDS:
                 enabled_val = (state_val == "ON")
             else:
                 enabled_val = bool(state_val)
 
-            self.commands_state[cmd_name] = {
-                        "enabled": tk.BooleanVar(value=enabled_val),
-                        "state": state_val if state_val else ("ON" if base_cmd in auto_commands else None),
-            }
-            
-            # Si es un comando repetible, restaurar variable de repeticiones
-            if base_cmd in repeatable_commands:
-                reps_key = f"{cmd_name}_reps"
-                saved_reps = last_state.get(reps_key, 1)
-                self.commands_state[cmd_name]["repetitions"] = tk.IntVar(value=saved_reps)
-
-            # Checkbox
-            checkbox = tk.Checkbutton(
-                row_frame, variable=self.commands_state[cmd_name]["enabled"], bg=bg_color
+            bit_idx = len(self._cmd_bit_index)
+            self._cmd_bit_index[cmd_name] = bit_idx
+            if enabled_val:
+                self._enabled_bits[bit_idx // 8] |= 1 << (bit_idx % 8)
+
+            checkbox = self.commands_state[cmd_name].checkbox
+            if enabled_val:
+                checkbox.select()
+            else:
+                checkbox.deselect()
+
+            # Reempaquetar en el orden deseado (no recrea el widget)
+            row["frame"].pack_forget()
+            row["frame"].pack(fill="x")
+            self.command_rows.append(row)
+
+    def _build_command_row(self, cmd_name, cmd_config, last_state):
+        """Crea los widgets de una fila de comando y devuelve su registro"""
+        # Comandos que necesitan columna de repeticiones
+        # Comandos que NO tienen botones (automáticos al marcar checkbox)
+
+        bg_color = "#f7f7f7"
+        row_frame = tk.Frame(self.commands_table_frame, relief="ridge", borderwidth=1, bg=bg_color, height=35)
+        row_frame.pack(fill="x")
+        row_frame.pack_propagate(False)
+        row_frame.grid_propagate(False)
+
+        # Configurar el grid para centrar verticalmente
+        row_frame.grid_rowconfigure(0, weight=1)
+
+        # Restaurar estado si existe, sino inicializar
+        state_val = last_state.get(cmd_name, None)
+
+        # Extraer comando base para verificar tipo
+        base_cmd = cmd_name.partition('#')[0]
+
+        self.commands_state[cmd_name] = _CmdRowState(
+            state_val if state_val else ("ON" if base_cmd in _AUTO_COMMANDS else None)
+        )
+
+        # Si es un comando repetible, restaurar variable de repeticiones
+        if base_cmd in _REPEATABLE_COMMANDS:
+            reps_key = f"{cmd_name}_reps"
+            saved_reps = last_state.get(reps_key, 1)
+            self.commands_state[cmd_name].repetitions = tk.IntVar(value=saved_reps)
+
+        # Checkbox: muta el bitmap directamente, sin BooleanVar intermedio
+        checkbox = tk.Checkbutton(
+            row_frame, bg=bg_color,
+            command=partial(self._toggle_enabled_bit, cmd_name)
+        )
+        checkbox.grid(row=0, column=0, padx=5, sticky="")
+        self.commands_state[cmd_name].checkbox = checkbox
+
+        # Nombre del comando
+        tk.Label(
+            row_frame, text=cmd_name, width=54, font=("Arial", 9), bg=bg_color
+        ).grid(row=0, column=1, sticky="w")
+
+        col_offset = 2
+
+        # Si es comando repetible, agregar spinbox de repeticiones
+        if base_cmd in _REPEATABLE_COMMANDS:
+            tk.Label(row_frame, text="Repetir:", font=("Arial", 8), bg=bg_color).grid(row=0, column=col_offset, padx=(5,2))
+            col_offset += 1
+
+            repetitions_spinbox = tk.Spinbox(
+                row_frame,
+                from_=1,
+                to=1000,
+                textvariable=self.commands_state[cmd_name].repetitions,
+                width=5,
+                justify="center"
             )
-            checkbox.grid(row=0, column=0, padx=5, sticky="")
+            repetitions_spinbox.grid(row=0, column=col_offset, padx=2)
+            col_offset += 1
 
-            # Nombre del comando
-            tk.Label(
-                row_frame, text=cmd_name, width=54, font=("Arial", 9), bg=bg_color
-            ).grid(row=0, column=1, sticky="w")
+        # Solo agregar botones si NO es un comando automático
+        if base_cmd not in _AUTO_COMMANDS:
+            # Obtener llaves para los botones
+            btn_keys = list(cmd_config.keys())
+            btn1_text = btn_keys[0] if len(btn_keys) > 0 else "ON"
+            btn2_text = btn_keys[1] if len(btn_keys) > 1 else "OFF"
 
-            col_offset = 2
+            # Botón ON
+            on_btn = tk.Button(
+                row_frame,
+                text=btn1_text,
+                width=8,
+                height=1,
+                bg="#e0e0e0",
+                command=partial(self.toggle_command_state, cmd_name, btn1_text),
+            )
+            on_btn.grid(row=0, column=col_offset, padx=2, pady=2)
+            col_offset += 1
 
-            # Si es comando repetible, agregar spinbox de repeticiones
-            if base_cmd in repeatable_commands:
-                tk.Label(row_frame, text="Repetir:", font=("Arial", 8), bg=bg_color).grid(row=0, column=col_offset, padx=(5,2))
-                col_offset += 1
-                
-                repetitions_spinbox = tk.Spinbox(
-                    row_frame,
-                    from_=1,
-                    to=1000,
-                    textvariable=self.commands_state[cmd_name]["repetitions"],
-                    width=5,
-                    justify="center"
-                )
-                repetitions_spinbox.grid(row=0, column=col_offset, padx=2)
-                col_offset += 1
-                
-            # Solo agregar botones si NO es un comando automático
-            if base_cmd not in auto_commands:
-                # Obtener llaves para los botones
-                btn_keys = list(cmd_config.keys())
-                btn1_text = btn_keys[0] if len(btn_keys) > 0 else "ON"
-                btn2_text = btn_keys[1] if len(btn_keys) > 1 else "OFF"
-
-                # Botón ON
-                on_btn = tk.Button(
+            # Guardar referencia del botón ON
+            self.commands_state[cmd_name].on_btn = on_btn
+
+            # Botón OFF si tiene dos opciones
+            if len(btn_keys) > 1:
+                off_btn = tk.Button(
                     row_frame,
-                    text=btn1_text,
+                    text=btn2_text,
                     width=8,
                     height=1,
                     bg="#e0e0e0",
-                    command=lambda cmd=cmd_name, state=btn1_text: self.toggle_command_state(cmd, state),
+                    command=partial(self.toggle_command_state, cmd_name, btn2_text),
                 )
-                on_btn.grid(row=0, column=col_offset, padx=2, pady=2)
+                off_btn.grid(row=0, column=col_offset, padx=2, pady=2)
+                self.commands_state[cmd_name].off_btn = off_btn
                 col_offset += 1
+            else:
+                self.commands_state[cmd_name].off_btn = None
 
-                # Guardar referencia del botón ON
-                self.commands_state[cmd_name]["on_btn"] = on_btn
-
-                # Botón OFF si tiene dos opciones
-                if len(btn_keys) > 1:
-                    off_btn = tk.Button(
-                        row_frame,
-                        text=btn2_text,
-                        width=8,
-                        height=1,
-                        bg="#e0e0e0",
-                        command=lambda cmd=cmd_name, state=btn2_text: self.toggle_command_state(cmd, state),
-                    )
-                    off_btn.grid(row=0, column=col_offset, padx=2, pady=2)
-                    self.commands_state[cmd_name]["off_btn"] = off_btn
-                    col_offset += 1
-                else:
-                    self.commands_state[cmd_name]["off_btn"] = None
-
-                # Cargar estado guardado si existe
-                if state_val == btn1_text:
-                    on_btn.config(bg="#27ae60", relief="sunken")
-                    if self.commands_state[cmd_name].get("off_btn"):
-                        self.commands_state[cmd_name]["off_btn"].config(bg="#e0e0e0", relief="raised")
-                elif state_val == btn2_text:
-                    if self.commands_state[cmd_name].get("off_btn"):
-                        self.commands_state[cmd_name]["off_btn"].config(bg="#e74c3c", relief="sunken")
-                    on_btn.config(bg="#e0e0e0", relief="raised")
-                else:
-                    on_btn.config(bg="#e0e0e0", relief="raised")
-                    if self.commands_state[cmd_name].get("off_btn"):
-                        self.commands_state[cmd_name]["off_btn"].config(bg="#e0e0e0", relief="raised")
+            # Cargar estado guardado si existe
+            if state_val == btn1_text:
+                on_btn.config(bg="#27ae60", relief="sunken")
+                if self.commands_state[cmd_name].off_btn:
+                    self.commands_state[cmd_name].off_btn.config(bg="#e0e0e0", relief="raised")
+            elif state_val == btn2_text:
+                if self.commands_state[cmd_name].off_btn:
+                    self.commands_state[cmd_name].off_btn.config(bg="#e74c3c", relief="sunken")
+                on_btn.config(bg="#e0e0e0", relief="raised")
             else:
-                # Para comandos automáticos, no hay botones
-                self.commands_state[cmd_name]["on_btn"] = None
-                self.commands_state[cmd_name]["off_btn"] = None
-                tk.Label(
-                    row_frame, 
-                    text="", 
-                    font=("Arial", 8, "italic"), 
-                    fg="gray",
-                    bg=bg_color
-                ).grid(row=0, column=col_offset, padx=10)
-
-            # Delta tiempo individual al final (recuperar de last_state o default 1.0)
-            saved_delta = last_state.get(f"{cmd_name}_delta", 1.0)
-            self.commands_state[cmd_name]["delta_time"] = tk.DoubleVar(value=saved_delta)
-            
-            # Label "Delay (s)"
+                on_btn.config(bg="#e0e0e0", relief="raised")
+                if self.commands_state[cmd_name].off_btn:
+                    self.commands_state[cmd_name].off_btn.config(bg="#e0e0e0", relief="raised")
+        else:
+            # Para comandos automáticos, no hay botones
+            self.commands_state[cmd_name].on_btn = None
+            self.commands_state[cmd_name].off_btn = None
             tk.Label(
-                row_frame, 
-                text="Delay (s):", 
-                font=("Arial", 8), 
-                bg=bg_color
-            ).grid(row=0, column=col_offset, padx=(5, 2))
-            col_offset += 1
-            
-            delta_spinbox = tk.Spinbox(
                 row_frame,
-                from_=0.1,
-                to=60.0,
-                increment=0.1,
-                textvariable=self.commands_state[cmd_name]["delta_time"],
-                width=6,
-                justify="center",
-                format="%.1f"
-            )
-            delta_spinbox.grid(row=0, column=col_offset, padx=2)
+                text="",
+                font=("Arial", 8, "italic"),
+                fg="gray",
+                bg=bg_color
+            ).grid(row=0, column=col_offset, padx=10)
 
-            self.command_rows.append({"frame": row_frame, "cmd_name": cmd_name})
-            self.setup_drag_and_drop(row_frame, cmd_name)
+        # Delta tiempo individual al final (recuperar de last_state o default 1.0)
+        saved_delta = last_state.get(f"{cmd_name}_delta", 1.0)
+        self.commands_state[cmd_name].delta_time = tk.DoubleVar(value=saved_delta)
 
-        # Vincular scroll a las nuevas filas creadas
-        self.root.after(150, self.bind_scroll_to_new_rows)
+        # Label "Delay (s)"
+        tk.Label(
+            row_frame,
+            text="Delay (s):",
+            font=("Arial", 8),
+            bg=bg_color
+        ).grid(row=0, column=col_offset, padx=(5, 2))
+        col_offset += 1
+
+        delta_spinbox = tk.Spinbox(
+            row_frame,
+            from_=0.1,
+            to=60.0,
+            increment=0.1,
+            textvariable=self.commands_state[cmd_name].delta_time,
+            width=6,
+            justify="center",
+            format="%.1f"
+        )
+        delta_spinbox.grid(row=0, column=col_offset, padx=2)
 
-    def bind_scroll_to_new_rows(self):
-        """Vincula eventos de scroll a las filas recién creadas de la tabla de comandos"""
-        def bind_mousewheel(widget):
-            widget.bind("<MouseWheel>", self.on_commands_mousewheel)
-            widget.bind("<Button-4>", self.on_commands_mousewheel)
-            widget.bind("<Button-5>", self.on_commands_mousewheel)
-        
-        def bind_to_children(parent):
-            try:
-                bind_mousewheel(parent)
-                for child in parent.winfo_children():
-                    if not isinstance(child, (tk.Spinbox, ttk.Combobox)):
-                        bind_to_children(child)
-            except Exception:
-                pass
-        
-        # Buscar el canvas padre en la pestaña de comandos
-        commands_tab = self.notebook.nametowidget(self.notebook.select())
-        for child in commands_tab.winfo_children():
-            if isinstance(child, tk.Canvas):
-                canvas = child
-                break
-        else:
-            return
-        
-        # Vincular a todas las filas nuevas
-        for row_data in self.command_rows:
-            bind_to_children(row_data["frame"])
+        self.setup_drag_and_drop(row_frame, cmd_name)
+        # Una pasada al crear la fila: agregar el bindtag de scroll (un solo
+        # handler de clase en la raíz atiende todos los widgets etiquetados)
+        self._tag_commands_scroll(row_frame)
+        return {"frame": row_frame, "cmd_name": cmd_name}
+
+    def _tag_commands_scroll(self, widget):
+        """Agrega el bindtag de scroll de comandos al widget y sus hijos
+
+        El handler real se registra una única vez con bind_class; etiquetar
+        cada widget nuevo es una llamada Tcl por widget al crearlo, en vez
+        de re-bindear recursivamente la tabla completa tras cada rebuild.
+        """
+        try:
+            tags = widget.bindtags()
+            if "CommandsScroll" not in tags:
+                widget.bindtags(("CommandsScroll",) + tags)
+            for child in widget.winfo_children():
+                # No etiquetar widgets que tienen su propio scroll
+                if not isinstance(
+                    child,
+                    (tk.Spinbox, ttk.Combobox, scrolledtext.ScrolledText,
+                     tk.Listbox, tk.Text),
+                ):
+                    self._tag_commands_scroll(child)
+        except Exception:
+            pass
+
+    def _refresh_command_row(self, cmd_name, cmd_config, last_state):
+        """Recarga el estado guardado en una fila existente sin recrear widgets"""
+
+        cmd_state = self.commands_state[cmd_name]
+        base_cmd = cmd_name.partition('#')[0]
+        state_val = last_state.get(cmd_name, None)
+        cmd_state.state = state_val if state_val else ("ON" if base_cmd in _AUTO_COMMANDS else None)
+
+        # Restaurar repeticiones y delta en las variables existentes
+        if cmd_state.repetitions is not None:
+            cmd_state.repetitions.set(last_state.get(f"{cmd_name}_reps", 1))
+        if cmd_state.delta_time is not None:
+            cmd_state.delta_time.set(last_state.get(f"{cmd_name}_delta", 1.0))
+
+        # Repintar los botones según el estado guardado
+        on_btn = cmd_state.on_btn
+        off_btn = cmd_state.off_btn
+        if on_btn is not None:
+            btn_keys = list(cmd_config.keys())
+            btn1_text = btn_keys[0] if len(btn_keys) > 0 else "ON"
+            btn2_text = btn_keys[1] if len(btn_keys) > 1 else "OFF"
+
+            if state_val == btn1_text:
+                on_btn.config(bg="#27ae60", relief="sunken")
+                if off_btn:
+                    off_btn.config(bg="#e0e0e0", relief="raised")
+            elif state_val == btn2_text:
+                if off_btn:
+                    off_btn.config(bg="#e74c3c", relief="sunken")
+                on_btn.config(bg="#e0e0e0", relief="raised")
+            else:
+                on_btn.config(bg="#e0e0e0", relief="raised")
+                if off_btn:
+                    off_btn.config(bg="#e0e0e0", relief="raised")
 
     def on_commands_mousewheel(self, event):
         """Manejador de scroll específico para la pestaña de comandos"""
@@ -503,12 +860,20 @@ class McControlApp:
         if os.path.exists(nombre_archivo):
             # El archivo existe: intenta cargarlo
             try:
-                with open(nombre_archivo, "r", encoding="utf-8") as f:
+                with open(nombre_archivo, "rb") as f:
                     # Intenta cargar el contenido en self.db
-                    self.db = json.load(f)
+                    self.db = _json_loads(f.read())
+                    # Reaplicar registros que quedaron solo en el log
+                    # incremental (sesión anterior cerrada sin snapshot)
+                    self._replay_mc_log()
                     matched_macs = self.db.get("mc_registered", {})
                     for mac_origin in matched_macs.keys():
-                        self.mc_registered[mac_origin] = matched_macs.get(mac_origin)
+                        # Normalizar la key a bytes (6 bytes) para lookups más rápidos
+                        mac_key = mac_to_bytes(mac_origin)
+                        data = matched_macs.get(mac_origin)
+                        self.mc_registered[mac_key] = data
+                        if data.get("mac_destiny"):
+                            self._by_mac_dst[data["mac_destiny"]] = mac_key
                     
                     # Cargar macros universales
                     self.macros = self.db.get("macros", {})
@@ -529,8 +894,9 @@ class McControlApp:
                     # Solo asegurarse de que self.db tenga la key si existe
 
                 print(f"Archivo '{nombre_archivo}' cargado exitosamente.")
-            except json.JSONDecodeError:
+            except ValueError:
                 # Caso: El archivo existe, pero está vacío o mal formado (corrupto)
+                # (json y orjson lanzan subclases de ValueError al fallar el parseo)
                 print(
                     f"Advertencia: '{nombre_archivo}' está vacío o corrupto. Inicializando con diccionario vacío."
                 )
@@ -545,16 +911,91 @@ class McControlApp:
             # El archivo NO existe: créalo e inicializa self.db
             self.db = {}
             try:
-                with open(nombre_archivo, "w", encoding="utf-8") as f:
-                    # Escribe el diccionario vacío en el nuevo archivo (con formato legible)
-                    json.dump(self.db, f, indent=4)
+                # Escribe el diccionario vacío en el nuevo archivo (con formato legible)
+                write_db_file(nombre_archivo, self.db)
                 print(f"Archivo '{nombre_archivo}' creado e inicializado con éxito.")
 
             except Exception as e:
                 print(f"Error al crear '{nombre_archivo}': {e}")
 
+    def _replay_mc_log(self):
+        """Fusiona los registros del log incremental sobre el snapshot cargado
+
+        Si la sesión anterior terminó antes del último snapshot, los MCs
+        registrados después del flush quedaron solo en el sidecar .log; acá
+        se reaplican sobre self.db antes de construir los índices en memoria.
+        """
+        if not os.path.exists(db_json_log):
+            return
+        try:
+            with open(db_json_log, "rb") as f:
+                lines = f.read().splitlines()
+        except Exception as e:
+            print(f"Error al leer '{db_json_log}': {e}")
+            return
+        if not lines:
+            return
+        persisted = self.db.setdefault("mc_registered", {})
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                entry = _json_loads(line)
+                persisted[entry["mac_origen"]] = entry["data"]
+            except (ValueError, KeyError, TypeError):
+                # Línea truncada por un corte a mitad de append: ignorar
+                continue
+        # Lo replayado debe llegar al próximo snapshot completo
+        self._db_dirty = True
+
+    def _append_mc_log(self, mac_origen, data):
+        """Anota un registro de MC en el log incremental (una línea JSON)
+
+        Registrar un MC escribe una sola línea corta al sidecar en vez de
+        reescribir db.json completo: el costo por alta pasa de
+        O(len(mc_registered)) a O(1) bytes. El snapshot consolidado se
+        mantiene por el flujo normal de guardado y el log se trunca después
+        de cada snapshot exitoso.
+
+        El handle se abre una sola vez y se mantiene (modo append): así cada
+        alta evita el open/close y sus updates de metadata del directorio.
+        El truncado desde el thread escritor es compatible porque O_APPEND
+        siempre escribe al final actual del archivo.
+        """
+        try:
+            if self._mc_log_fp is None:
+                self._mc_log_fp = open(db_json_log, "ab")
+            self._mc_log_fp.write(
+                _json_dumps({"mac_origen": mac_origen, "data": data}) + b"\n"
+            )
+            self._mc_log_fp.flush()
+        except Exception as e:
+            print(f"Error al escribir '{db_json_log}': {e}")
+
+    def _close_mc_log(self):
+        """Cierra el handle persistente del log incremental"""
+        if self._mc_log_fp is not None:
+            try:
+                self._mc_log_fp.close()
+            except Exception:
+                pass
+            self._mc_log_fp = None
+
     def create_main_interface(self):
         """Crea la interfaz principal de la aplicación"""
+        # Barra de estado no modal: informa resultados sin bloquear el loop
+        # de eventos como lo hace un messagebox
+        self.status_label = ttk.Label(self.root, text="", anchor="w")
+        self.status_label.pack(fill="x", side="bottom", padx=10, pady=(0, 5))
+        self._status_clear_job = None
+
+        # Un único bind de clase para el scroll de la tabla de comandos: las
+        # filas nuevas solo se etiquetan con el bindtag "CommandsScroll"
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind_class(
+                "CommandsScroll", sequence, self.on_commands_mousewheel
+            )
+
         # Notebook para las pestañas
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
@@ -566,6 +1007,20 @@ class McControlApp:
         # Menú
         self.create_menu()
 
+    def _set_status(self, text, level="info"):
+        """Muestra un mensaje en la barra de estado y lo limpia a los 3 s
+
+        A diferencia de messagebox.showinfo, no es modal: registrar varios
+        MCs seguidos no obliga a cerrar un diálogo por cada uno.
+        """
+        colors = {"info": "dark green", "error": "red"}
+        self.status_label.config(text=text, foreground=colors.get(level, "black"))
+        if self._status_clear_job is not None:
+            self.root.after_cancel(self._status_clear_job)
+        self._status_clear_job = self.root.after(
+            3000, lambda: self.status_label.config(text="")
+        )
+
     def create_dashboard_tab(self):
         """Crea la pestaña del dashboard con scroll corregido"""
         dashboard_frame = ttk.Frame(self.notebook)
@@ -678,9 +1133,10 @@ class McControlApp:
 
         # Insertar datos iniciales
         for mac_source, interfaz in self.mc_available.items():
-            if self.mc_registered.get(f"{mac_source}"):
-                mac_destiny = self.mc_registered.get(f"{mac_source}").get("mac_destiny")
-                label = self.mc_registered.get(f"{mac_source}").get("label")
+            mc_data = self.mc_registered.get(mac_to_bytes(mac_source))
+            if mc_data:
+                mac_destiny = mc_data.get("mac_destiny")
+                label = mc_data.get("label")
                 self.mc_table.insert(
                     "", "end", values=(interfaz, mac_source, mac_destiny, label)
                 )
@@ -924,9 +1380,13 @@ class McControlApp:
                 # Solo actualizar si tiene MC asignado
                 if self.pet_associations[i]["mc"] is not None:
                     self.pet_associations[i]["enabled"] = value
-                    # Actualizar variable del checkbox
-                    if hasattr(self, 'pet_checkbox_vars') and i in self.pet_checkbox_vars:
-                        self.pet_checkbox_vars[i].set(value)
+                    # Actualizar el widget directamente (sin BooleanVar)
+                    checkbox = self.pet_checkboxes.get(i)
+                    if checkbox is not None:
+                        if value:
+                            checkbox.select()
+                        else:
+                            checkbox.deselect()
             
             # Guardar estado en DB después de actualizar todos
             self.update_db_stats()
@@ -953,61 +1413,60 @@ class McControlApp:
 
         self.pet_buttons = []
         self.pet_tooltips = []  # Lista para mantener referencias a tooltips
-        self.pet_checkbox_vars = {}  # Diccionario para mantener referencias a las variables
+        self.pet_checkboxes = {}  # Referencias directas a los widgets checkbox
+
+        # Función para actualizar el estado cuando cambie un checkbox,
+        # definida una sola vez fuera del loop de construcción. El estado
+        # vive en pet_associations; el widget solo refleja (sin BooleanVar)
+        def update_pet_enabled(pet_num):
+            # Solo permitir cambio si tiene MC asignado
+            if self.pet_associations[pet_num]["mc"] is None:
+                self.pet_checkboxes[pet_num].deselect()  # Forzar a False
+                return
+
+            # El widget ya alternó su indicador: reflejar en el modelo
+            self.pet_associations[pet_num]["enabled"] = not self.pet_associations[pet_num]["enabled"]
+
+            # Guardar en DB cuando cambia el estado del checkbox
+            self.update_db_stats()
+
+            # Actualizar el checkbox "Seleccionar todos" si es necesario
+            all_selected = all(
+                self.pet_associations[j]["enabled"]
+                for j in range(1, 11)
+                if self.pet_associations[j]["mc"] is not None
+            )
+            self.select_all_pets_var.set(all_selected)
 
         for i in range(num_pets):
-            angle = (2 * math.pi / num_pets) * i - (math.pi / 2) 
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
+            # Posición sobre el anillo desde la tabla precalculada
+            unit_x, unit_y = _PET_RING[i]
+            x = center_x + radius * unit_x
+            y = center_y + radius * unit_y
 
             # Calcular posición del checkbox (arriba y más cerca del botón)
             checkbox_offset = 30
             cb_x = x
             cb_y = y - checkbox_offset
 
-            # Crear variable BooleanVar vinculada al estado en pet_associations
-            pet_enabled_var = tk.BooleanVar(value=self.pet_associations[i+1]["enabled"])
-            self.pet_checkbox_vars[i+1] = pet_enabled_var  # Guardar referencia
-            
-            # Función para actualizar el estado cuando cambie el checkbox
-            def update_pet_enabled(pet_num, var):
-                # Solo permitir cambio si tiene MC asignado
-                if self.pet_associations[pet_num]["mc"] is None:
-                    var.set(False)  # Forzar a False
-                    return
-                
-                self.pet_associations[pet_num]["enabled"] = var.get()
-                
-                # Guardar en DB cuando cambia el estado del checkbox
-                self.update_db_stats()
-                
-                # Actualizar el checkbox "Seleccionar todos" si es necesario
-                all_selected = all(
-                    self.pet_associations[j]["enabled"] 
-                    for j in range(1, 11) 
-                    if self.pet_associations[j]["mc"] is not None
-                )
-                self.select_all_pets_var.set(all_selected)
-            
-            # Deshabilitar checkbox si no tiene MC
+            # Estado y color según si tiene MC asignado (una sola consulta)
             has_mc = self.pet_associations[i+1]["mc"] is not None
             checkbox_state = "normal" if has_mc else "disabled"
-            
-            # Crear checkbox
+            btn_bg = "#3498db" if has_mc else "#e67e22"  # Azul si tiene MC, naranja si no
+
+            # Crear checkbox (sin BooleanVar: el modelo vive en pet_associations)
             pet_checkbox = tk.Checkbutton(
                 pet_canvas,
-                variable=pet_enabled_var,
                 bg="white",
                 activebackground="white",
                 state=checkbox_state,
-                command=lambda num=i+1, v=pet_enabled_var: update_pet_enabled(num, v)
+                command=partial(update_pet_enabled, i + 1)
             )
+            if self.pet_associations[i+1]["enabled"]:
+                pet_checkbox.select()
+            self.pet_checkboxes[i+1] = pet_checkbox  # Guardar referencia
             pet_canvas.create_window(cb_x, cb_y, window=pet_checkbox)
 
-            # Determinar color según si tiene MC asignado
-            has_mc = self.pet_associations[i+1]["mc"] is not None
-            btn_bg = "#3498db" if has_mc else "#e67e22"  # Azul si tiene MC, naranja si no
-            
             # Crear botón con bordes redondeados
             pet_btn = tk.Button(
                 pet_canvas,
@@ -1063,32 +1522,18 @@ class McControlApp:
         )
         self.response_text.pack(fill="both", expand=True)
         
-    def setup_pet_tooltip(self, button, pet_num):
-        """Configura el tooltip hover para un botón PET"""
-        tooltip = None
-        
-        def show_tooltip(event):
-            nonlocal tooltip
-            
-            # Obtener información de asociación
-            assoc = self.pet_associations[pet_num]
-            mc_label = "Sin MC"
-            
-            if assoc["mc"]:
-                # Buscar el label del MC
-                for mc_data in self.mc_registered.values():
-                    if mc_data.get("mac_destiny") == assoc["mc"]:
-                        mc_label = mc_data.get("label", "Sin etiqueta")
-                        break
-            
-            # Crear tooltip
-            x = button.winfo_rootx() + button.winfo_width() // 2
-            y = button.winfo_rooty() - 10
-            
-            tooltip = tk.Toplevel(button)
+    def _get_pet_tooltip(self):
+        """Devuelve el Toplevel compartido de tooltips de PET, creándolo una vez
+
+        Un único tooltip oculto se reutiliza para los 10 botones: cada hover
+        solo actualiza textos y posición (withdraw/deiconify) en vez de
+        crear y destruir un Toplevel con frame y labels.
+        """
+        if getattr(self, "_pet_tooltip", None) is None:
+            tooltip = tk.Toplevel(self.root)
             tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{x}+{y}")
-            
+            tooltip.withdraw()
+
             # Frame contenedor con borde
             frame = tk.Frame(
                 tooltip,
@@ -1097,52 +1542,70 @@ class McControlApp:
                 borderwidth=1
             )
             frame.pack(fill="both", expand=True)
-            
-            # Contenido del tooltip
-            tk.Label(
+
+            self._pet_tooltip_title = tk.Label(
                 frame,
-                text=f"PET {pet_num}",
                 font=("Arial", 9, "bold"),
                 bg="#2c3e50",
                 fg="white",
                 padx=10,
                 pady=2
-            ).pack()
-            
-            tk.Label(
+            )
+            self._pet_tooltip_title.pack()
+
+            self._pet_tooltip_mc = tk.Label(
                 frame,
-                text=f"MC: {mc_label}",
                 font=("Arial", 8),
                 bg="#2c3e50",
                 fg="#ecf0f1",
                 padx=10,
                 pady=2
-            ).pack()
-            
+            )
+            self._pet_tooltip_mc.pack()
+
+            self._pet_tooltip = tooltip
+        return self._pet_tooltip
+
+    def setup_pet_tooltip(self, button, pet_num):
+        """Configura el tooltip hover para un botón PET"""
+
+        def show_tooltip(event):
+            # Obtener información de asociación
+            assoc = self.pet_associations[pet_num]
+            mc_label = "Sin MC"
+
+            if assoc["mc"]:
+                # Buscar el label del MC
+                _, mc_data = self._lookup_mc(assoc["mc"])
+                if mc_data:
+                    mc_label = mc_data.get("label", "Sin etiqueta")
+
+            # Reutilizar el tooltip compartido: solo textos y posición
+            x = button.winfo_rootx() + button.winfo_width() // 2
+            y = button.winfo_rooty() - 10
+
+            tooltip = self._get_pet_tooltip()
+            self._pet_tooltip_title.config(text=f"PET {pet_num}")
+            self._pet_tooltip_mc.config(text=f"MC: {mc_label}")
+
             # Ajustar posición para que aparezca arriba del botón
             tooltip.update_idletasks()
             tooltip_height = tooltip.winfo_height()
             tooltip.wm_geometry(f"+{x - tooltip.winfo_width()//2}+{y - tooltip_height - 5}")
-        
+            tooltip.deiconify()
+
         def hide_tooltip(event=None):
-            nonlocal tooltip
-            if tooltip:
-                tooltip.destroy()
-                tooltip = None
-        
-        # Handler para el clic que oculta el tooltip antes de abrir el modal
-        def on_click(event):
-            hide_tooltip()
-            # Dar un pequeño delay para que el tooltip se destruya antes del modal
-            button.after(10, lambda: button.invoke())
-            return "break"  # Prevenir propagación
-        
+            if getattr(self, "_pet_tooltip", None) is not None:
+                self._pet_tooltip.withdraw()
+
         button.bind("<Enter>", show_tooltip)
         button.bind("<Leave>", hide_tooltip)
-        button.bind("<Button-1>", on_click)
 
     def on_pet_click(self, pet_num):
         """Maneja el clic en un botón PET - abre modal de configuración"""
+        # Ocultar el tooltip compartido antes de abrir el modal (withdraw es síncrono)
+        if getattr(self, "_pet_tooltip", None) is not None:
+            self._pet_tooltip.withdraw()
         # Crear modal pero no hacer grab_set inmediatamente
         modal = tk.Toplevel(self.root)
         modal.title(f"Configurar PET {pet_num}")
@@ -1192,15 +1655,13 @@ class McControlApp:
         
         mc_var = tk.StringVar()
         mc_options = ["Sin MC"] + self.get_mc_display_list()
-        
-        # Establecer valor inicial
-        if current_assoc["mc"]:
-            for option in mc_options:
-                if " | " in option and option.split(" | ")[1] == current_assoc["mc"]:
-                    mc_var.set(option)
-                    break
-        else:
-            mc_var.set("Sin MC")
+
+        # Establecer valor inicial: lookup directo en el mapa mac -> display
+        # que se arma junto con la lista, sin recorrer las opciones
+        mc_var.set(
+            self._mc_display_by_mac.get(current_assoc["mc"], "Sin MC")
+            if current_assoc["mc"] else "Sin MC"
+        )
         
         mc_combo = ttk.Combobox(
             mc_frame,
@@ -1238,11 +1699,10 @@ class McControlApp:
                             self.pet_buttons[other_btn_index].config(bg="#e67e22")
                         
                         # Deshabilitar y desmarcar checkbox del otro PET
-                        if other_pet_num in self.pet_checkbox_vars:
-                            self.pet_checkbox_vars[other_pet_num].set(False)
-                            # Buscar el widget checkbox para deshabilitarlo
-                            for widget in self.root.winfo_children():
-                                self.find_and_disable_checkbox(widget, other_pet_num)
+                        other_checkbox = self.pet_checkboxes.get(other_pet_num)
+                        if other_checkbox is not None:
+                            other_checkbox.deselect()
+                            other_checkbox.config(state="disabled")
                         
                         self.add_response(f"⚠️ PET {other_pet_num} desasignado (MC reasignado a PET {pet_num})")
                         break
@@ -1256,14 +1716,12 @@ class McControlApp:
                 new_bg = "#3498db" if has_mc else "#e67e22"
                 self.pet_buttons[btn_index].config(bg=new_bg)
                 
-                # Actualizar estado del checkbox
-                if pet_num in self.pet_checkbox_vars:
+                # Actualizar estado del checkbox directamente
+                checkbox = self.pet_checkboxes.get(pet_num)
+                if checkbox is not None:
                     if not has_mc:
-                        self.pet_checkbox_vars[pet_num].set(False)
-                    
-                    # Buscar el widget checkbox para habilitarlo/deshabilitarlo
-                    for widget in self.root.winfo_children():
-                        self.find_and_update_checkbox(widget, pet_num, has_mc)
+                        checkbox.deselect()
+                    checkbox.config(state="normal" if has_mc else "disabled")
             
             # Guardar en db
             self.update_db_stats()
@@ -1293,40 +1751,41 @@ class McControlApp:
         )
         cancelar_btn.pack(side="right", padx=(10, 80))
 
-    def find_and_update_checkbox(self, widget, pet_num, enabled):
-        """Busca recursivamente el checkbox de un PET y actualiza su estado"""
-        try:
-            # Si es un Canvas, buscar en sus hijos
-            if isinstance(widget, tk.Canvas):
-                for item in widget.find_all():
-                    item_widget = widget.nametowidget(widget.itemcget(item, 'window'))
-                    if isinstance(item_widget, tk.Checkbutton):
-                        # Verificar si es el checkbox del PET correcto
-                        # (comparando con la variable asociada)
-                        if hasattr(item_widget, 'cget'):
-                            try:
-                                var_name = str(item_widget.cget('variable'))
-                                if var_name and pet_num in self.pet_checkbox_vars:
-                                    checkbox_var_name = str(self.pet_checkbox_vars[pet_num])
-                                    if var_name == checkbox_var_name:
-                                        new_state = "normal" if enabled else "disabled"
-                                        item_widget.config(state=new_state)
-                                        return True
-                            except:
-                                pass
-            
-            # Buscar recursivamente en los hijos del widget
-            for child in widget.winfo_children():
-                if self.find_and_update_checkbox(child, pet_num, enabled):
-                    return True
-        except:
-            pass
-        return False
-    
-    def find_and_disable_checkbox(self, widget, pet_num):
-        """Busca recursivamente el checkbox de un PET y lo deshabilita"""
-        return self.find_and_update_checkbox(widget, pet_num, False)
-    
+    def get_frame_prefix(self, mac_origen_bytes, mac_destino):
+        """Obtiene la cabecera fija de la trama para un MC, calculándola una sola vez
+
+        La cabecera (MAC destino + MAC origen + largo + padding + constantes) no
+        cambia entre envíos; solo varía el byte de comando que se concatena al final.
+        """
+        prefix = self.frame_prefix_cache.get(mac_origen_bytes)
+        if prefix is None:
+            prefix = mac_to_bytes(mac_destino) + mac_origen_bytes + _FRAME_HEADER_TAIL
+            self.frame_prefix_cache[mac_origen_bytes] = prefix
+        return prefix
+
+    def get_frame(self, mac_origen_bytes, mac_destino, appendix_key):
+        """Obtiene la trama completa (cabecera + byte de comando) ya armada
+
+        Las tramas de cada MC se construyen una sola vez para todos los
+        comandos: el envío queda en un lookup de dict más el send() del socket.
+        """
+        frames = self.frame_cache.get(mac_origen_bytes)
+        if frames is None:
+            prefix = self.get_frame_prefix(mac_origen_bytes, mac_destino)
+            frames = {name: prefix + payload for name, payload in appendix_dict.items()}
+            self.frame_cache[mac_origen_bytes] = frames
+        return frames[appendix_key]
+
+    def get_l2_socket(self, interface):
+        """Obtiene un socket raw (AF_PACKET) ligado a la interfaz, reutilizándolo entre envíos"""
+        sock = self.l2_sockets.get(interface)
+        if sock is None:
+            # ETH_P_ALL = 3: enviar/recibir cualquier protocolo de capa 2
+            sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(3))
+            sock.bind((interface, 0))
+            self.l2_sockets[interface] = sock
+        return sock
+
     def toggle_send_pet_commands(self):
         """Alterna entre enviar y cancelar comandos PET"""
         if self.sending_pet_commands:
@@ -1359,16 +1818,15 @@ class McControlApp:
                 # Buscar información del MC
                 mc_mac = self.pet_associations[pet_num]["mc"]
                 mc_info = None
-                for mac_src, data in self.mc_registered.items():
-                    if data.get("mac_destiny") == mc_mac:
-                        mc_info = {
-                            "pet_num": pet_num,
-                            "mac_origen": mac_src,
-                            "mac_destino": mc_mac,
-                            "interface": data.get("interface_destiny"),
-                            "label": data.get("label", "Sin etiqueta")
-                        }
-                        break
+                mac_src, data = self._lookup_mc(mc_mac)
+                if data:
+                    mc_info = {
+                        "pet_num": pet_num,
+                        "mac_origen": mac_src,
+                        "mac_destino": mc_mac,
+                        "interface": data.get("interface_destiny"),
+                        "label": data.get("label", "Sin etiqueta")
+                    }
                 
                 if mc_info:
                     pets_to_send.append(mc_info)
@@ -1387,11 +1845,9 @@ class McControlApp:
         
         # Construir lista de comandos a enviar
         commands_to_send = []
-        auto_commands = ["X_FF_Reset", "X_02_TestTrigger", "X_03_RO_Single"]
-        repeatable_commands = ["X_02_TestTrigger", "X_03_RO_Single"]
         
         for cmd_name, cmd_config in command_configs.items():
-            base_cmd = cmd_name.split('#')[0] if '#' in cmd_name else cmd_name
+            base_cmd = cmd_name.partition('#')[0]
             cmd_last_state = last_state.get(cmd_name, "")
             
             # Saltar comandos sin estado definido
@@ -1402,13 +1858,13 @@ class McControlApp:
             delta_time = last_state.get(f"{cmd_name}_delta", 1.0)
             
             # Para comandos automáticos
-            if base_cmd in auto_commands:
+            if base_cmd in _AUTO_COMMANDS:
                 if cmd_last_state == "ON":
                     appendix_key = cmd_config["ON"]
                     
                     # Obtener repeticiones si aplica
                     repetitions = 1
-                    if base_cmd in repeatable_commands:
+                    if base_cmd in _REPEATABLE_COMMANDS:
                         repetitions = last_state.get(f"{cmd_name}_reps", 1)
                     
                     commands_to_send.append({
@@ -1444,107 +1900,60 @@ class McControlApp:
         self.add_response(f"📡 Enviando macro '{selected_macro_name}' a {len(pets_to_send)} PET(s)")
         self.add_response(f"   Total de comandos por PET: {total_commands}")
         
-        # Función para enviar comandos a un PET específico
-        def send_to_pet(pet_info, commands):
-            """Envía todos los comandos a un PET específico"""
-            pet_num = pet_info["pet_num"]
-            mac_origen = pet_info["mac_origen"]
-            mac_destino = pet_info["mac_destino"]
-            interface = pet_info["interface"]
-            
-            try:
-                cmd_index = 1
-                total = sum(c["repetitions"] for c in commands)
-                
-                for cmd_info in commands:
-                    repetitions = cmd_info["repetitions"]
-                    delta_time = cmd_info["delta_time"]
-                    
-                    for rep in range(repetitions):
-                        # Verificar cancelación
-                        if self.cancel_pet_sending:
-                            self.add_response(f"⚠️ PET {pet_num}: Cancelado después de {cmd_index-1}/{total} comandos")
-                            return
-                        
-                        # Construir paquete
-                        try:
-                            appendix = appendix_dict.get(cmd_info["appendix_key"])
-                            mac_origen_bytes = bytes.fromhex(mac_origen.replace(":", ""))
-                            mac_destino_bytes = bytes.fromhex(mac_destino.replace(":", ""))
-                            payload_length = 7
-                            length_bytes = payload_length.to_bytes(2, byteorder="big")
-                            padding_bytes = b"\x00\x00\x00\x00"
-                            constant_bytes = b"\x02\x03"
-                            
-                            packet = (
-                                mac_destino_bytes
-                                + mac_origen_bytes
-                                + length_bytes
-                                + padding_bytes
-                                + constant_bytes
-                                + appendix
-                            )
-                            
-                            # Enviar
-                            scapy_packet = Raw(load=packet)
-                            sendp(scapy_packet, iface=interface, verbose=False)
-                            
-                            rep_info = f" (rep {rep+1}/{repetitions})" if repetitions > 1 else ""
-                            self.add_response(f"✓ PET {pet_num} [{cmd_index}/{total}]: {cmd_info['appendix_key']}{rep_info}")
-                            
-                        except Exception as e:
-                            self.add_response(f"✗ PET {pet_num} Error en {cmd_info['appendix_key']}: {str(e)}")
-                        
-                        cmd_index += 1
-                        
-                        # Esperar delta_time después de cada envío
-                        delay_cancelled = False
-                        for _ in range(int(delta_time * 10)):
-                            if self.cancel_pet_sending:
-                                self.add_response(f"⚠️ PET {pet_num}: Cancelado después de {cmd_index-1}/{total} comandos")
-                                delay_cancelled = True
-                                break
-                            time.sleep(0.1)
-                        
-                        if delay_cancelled:
-                            return
-                
-                if not self.cancel_pet_sending:
-                    self.add_response(f"✓ PET {pet_num}: Todos los comandos enviados")
-                    
-            except Exception as e:
-                self.add_response(f"✗ PET {pet_num}: Error general - {str(e)}")
-        
-        # Función para coordinar todos los envíos
-        def send_all_pets():
-            threads = []
-            
-            # Crear un thread por cada PET
-            for pet_info in pets_to_send:
-                thread = threading.Thread(
-                    target=send_to_pet,
-                    args=(pet_info, commands_to_send),
-                    daemon=True
-                )
-                threads.append(thread)
-                thread.start()
-            
-            # Esperar a que todos los threads terminen
-            for thread in threads:
-                thread.join()
-            
-            if not self.cancel_pet_sending:
+        # Aplanar el cronograma en pasos programables con after(): cada paso
+        # envía un comando a todos los PETs habilitados y espera delta_time
+        # sin bloquear el loop de eventos ni necesitar threads
+        send_steps = []
+        for cmd_info in commands_to_send:
+            for rep in range(cmd_info["repetitions"]):
+                send_steps.append((cmd_info, rep))
+
+        total = sum(c["repetitions"] for c in commands_to_send)
+
+        def finish_pet_sending(cancelled, cmd_index):
+            if cancelled:
+                self.add_response(f"⚠️ Cancelado después de {cmd_index-1}/{total} comandos")
+            else:
                 self.add_response("✓ Envío completado a todos los PETs")
-            
+
             self.add_response("=" * 50)
-            
+
             # Restaurar botón
             self.sending_pet_commands = False
             self.cancel_pet_sending = False
             self.send_pet_btn.config(text="Enviar", bg="#27ae60")
-        
-        # Ejecutar en thread principal
-        threading.Thread(target=send_all_pets, daemon=True).start()
+
+        def send_pet_tick(step, cmd_index):
+            """Envía un paso a todos los PETs y se reprograma con after()"""
+            if self.cancel_pet_sending:
+                finish_pet_sending(True, cmd_index)
+                return
+
+            if step >= len(send_steps):
+                finish_pet_sending(False, cmd_index)
+                return
+
+            cmd_info, rep = send_steps[step]
+            repetitions = cmd_info["repetitions"]
+            rep_info = f" (rep {rep+1}/{repetitions})" if repetitions > 1 else ""
+
+            # Enviar la trama precalculada a cada PET habilitado
+            for pet_info in pets_to_send:
+                try:
+                    frame = self.get_frame(pet_info["mac_origen"], pet_info["mac_destino"],
+                                           cmd_info["appendix_key"])
+                    self.get_l2_socket(pet_info["interface"]).send(frame)
+
+                    self.add_response(f"✓ PET {pet_info['pet_num']} [{cmd_index}/{total}]: {cmd_info['appendix_key']}{rep_info}")
+
+                except Exception as e:
+                    self.add_response(f"✗ PET {pet_info['pet_num']} Error en {cmd_info['appendix_key']}: {str(e)}")
+
+            # Esperar delta_time antes del siguiente paso sin bloquear la UI
+            delay_ms = max(int(cmd_info["delta_time"] * 1000), 1)
+            self.root.after(delay_ms, lambda: send_pet_tick(step + 1, cmd_index + 1))
+
+        send_pet_tick(0, 1)
 
     def create_commands_tab(self):
         """Crea la pestaña de comandos con scroll corregido"""
@@ -1569,54 +1978,23 @@ class McControlApp:
         )
         canvas.configure(yscrollcommand=scrollbar.set)
 
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        # Función para ajustar el ancho del frame interno cuando el canvas cambie de tamaño
-        def configure_canvas_width(event):
-            canvas.itemconfig(canvas_window, width=event.width)
-        
-        canvas.bind("<Configure>", configure_canvas_width)
-
-        # Sistema mejorado de scroll con rueda del mouse
-        def bind_mousewheel(widget):
-            """Vincula eventos de scroll a un widget específico"""
-            widget.bind("<MouseWheel>", on_mousewheel)
-            widget.bind("<Button-4>", on_mousewheel)
-            widget.bind("<Button-5>", on_mousewheel)
-
-        def on_mousewheel(event):
-            """Maneja todos los eventos de scroll del mouse"""
-            # Determinar la dirección del scroll
-            if event.num == 5 or (hasattr(event, "delta") and event.delta < 0):
-                canvas.yview_scroll(1, "units")
-            elif event.num == 4 or (hasattr(event, "delta") and event.delta > 0):
-                canvas.yview_scroll(-1, "units")
-            return "break"  # Prevenir propagación del evento
-
-        # Vincular scroll al canvas principal
-        bind_mousewheel(canvas)
-        
-        # Vincular scroll al frame desplazable y a todos sus hijos
-        def bind_to_all_children(parent):
-            """Vincula eventos de scroll recursivamente a todos los widgets hijos"""
-            try:
-                bind_mousewheel(parent)
-                for child in parent.winfo_children():
-                    # No vincular a widgets que tienen su propio scroll
-                    if not isinstance(child, (scrolledtext.ScrolledText, tk.Listbox, tk.Text, ttk.Combobox, tk.Spinbox)):
-                        bind_to_all_children(child)
-            except Exception:
-                pass  # Ignorar errores en widgets que no soportan binding
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
 
-        # Vincular después de que la UI esté completamente construida
-        def bind_scroll_after_ui():
-            bind_to_all_children(scrollable_frame)
-            # También vincular el canvas mismo
-            bind_mousewheel(canvas)
+        # Función para ajustar el ancho del frame interno cuando el canvas cambie de tamaño
+        def configure_canvas_width(event):
+            canvas.itemconfig(canvas_window, width=event.width)
+        
+        canvas.bind("<Configure>", configure_canvas_width)
 
-        # Programar el binding después de que la UI esté creada
-        self.root.after(100, bind_scroll_after_ui)
+        # Scroll con rueda del mouse: un solo handler de clase (registrado en
+        # create_main_interface) atiende todo el árbol; aquí solo se etiqueta
+        # cada widget con el bindtag una vez construida la pestaña.
+        # El canvas además se bindea directo: el handler retorna "break", así
+        # que no se dispara dos veces, y el binding queda visible en .bind()
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            canvas.bind(sequence, self.on_commands_mousewheel)
+        self.root.after(100, lambda: self._tag_commands_scroll(canvas))
 
         # Select MC Destino (arriba de ambos frames)
         mc_select_frame = tk.Frame(scrollable_frame)
@@ -1698,8 +2076,8 @@ class McControlApp:
         # Checkbox "Seleccionar todo"
         def toggle_all_commands():
             value = select_all_cb_var.get()
-            for cmd_state in self.commands_state.values():
-                cmd_state["enabled"].set(value)
+            for cmd_name in self.commands_state:
+                self._set_cmd_enabled(cmd_name, value)
 
         select_all_cb_var = tk.BooleanVar(value=False)
         select_all_cb = tk.Checkbutton(
@@ -1720,31 +2098,9 @@ class McControlApp:
             row=0, column=3
         )
 
-        # Definir comandos con sus appendix
-        self.command_configs = {
-            "X_02_TestTrigger": {"ON": "X_02_TestTrigger"},  
-            "X_03_RO_Single": {"ON": "X_03_RO_Single"},
-            "X_04_RO_ON | X_05_RO_OFF": {"ON": "X_04_RO_ON", "OFF": "X_05_RO_OFF"},
-            "X_08_DIAG_ | X_09_DIAG_DIS": {"ON": "X_08_DIAG_", "OFF": "X_09_DIAG_DIS"},
-            "X_FB_TTrig_Auto_EN | X_FC_TTrig_Auto_DIS": {
-                "ON": "X_FB_TTrig_Auto_EN",
-                "OFF": "X_FC_TTrig_Auto_DIS",
-            },
-            "X_FF_Reset": {"ON": "X_FF_Reset"},
-            "X_20_PwrDwnb_TOP_ON | X_21_PwrDwnb_TOP_OFF": {"ON": "X_20_PwrDwnb_TOP_ON", "OFF": "X_21_PwrDwnb_TOP_OFF"},
-            "X_22_PwrDwnb_BOT_ON | X_23_PwrDwnb_BOT_OFF": {
-                "ON": "X_22_PwrDwnb_BOT_ON",
-                "OFF": "X_23_PwrDwnb_BOT_OFF",
-            },
-            "X_26_PwrEN_2V4D_ON | X_27_PwrEN_2V4D_OFF": {"ON": "X_26_PwrEN_2V4D_ON", "OFF": "X_27_PwrEN_2V4D_OFF"},
-            "X_28_PwrEN_3V1_ON | X_29_PwrEN_3V1_OFF": {"ON": "X_28_PwrEN_3V1_ON", "OFF": "X_29_PwrEN_3V1_OFF"},
-            "X_2A_PwrEN_1V8A_ON | X_2B_PwrEN_1V8A_OFF": {"ON": "X_2A_PwrEN_1V8A_ON", "OFF": "X_2B_PwrEN_1V8A_OFF"},
-            "X_E1_FanSpeed0_High | X_E0_FanSpeed0_Low": {
-            "HIGH": "X_E1_FanSpeed0_High", "LOW": "X_E0_FanSpeed0_Low"
-            },
-            "X_F9_TTrig_Global | X_FA_TTrig_Local": {"GLOBAL": "X_F9_TTrig_Global", "LOCAL": "X_FA_TTrig_Local"},
-            "X_E3_FanSpeed1_High | X_E2_FanSpeed1_Low": {"HIGH": "X_E3_FanSpeed1_High", "LOW": "X_E2_FanSpeed1_Low"},
-        }
+        # Definición de comandos: tabla fija a nivel de módulo (nunca se muta;
+        # las listas por MC se arman en command_configs de cada MC)
+        self.command_configs = _COMMAND_CONFIGS
 
         # Estado de comandos: {comando: {"enabled": bool, "state": "ON"/"OFF"/None}}
         self.commands_state = {}
@@ -1801,12 +2157,8 @@ class McControlApp:
             return
 
         # Buscar el MC seleccionado
-        mc_data = None
-        for data in self.mc_registered.values():
-            if data.get("mac_destiny") == selected_mc:
-                mc_data = data
-                break
-        
+        _, mc_data = self._lookup_mc(selected_mc)
+
         if not mc_data:
             messagebox.showwarning("Validación", "Micro Controlador no encontrado.")
             return
@@ -1872,111 +2224,62 @@ class McControlApp:
                 bg="#f7f7f7"
             ).pack(anchor="w", padx=20, pady=(10, 5))
 
-            # Frame con scroll para las macros - altura dinámica según cantidad
-            max_height = min(250, len(existing_macros) * 35 + 10)  # Máximo 250px
-            macros_canvas_frame = tk.Frame(modal, bg="#f7f7f7", height=max_height)
-            macros_canvas_frame.pack(fill="x", padx=20, pady=(0, 10))  # <-- CAMBIAR fill="both" a fill="x"
-            macros_canvas_frame.pack_propagate(False)
-
-            macros_canvas = tk.Canvas(
-                macros_canvas_frame,
-                bg="#f7f7f7",
-                highlightthickness=1,
-                highlightbackground="#ccc"
+            # Un único Treeview (filas renderizadas en C, sin truncado manual
+            # ni tooltips) en vez de un canvas con frame + label + botón por
+            # macro: 3 widgets en total independiente de cuántas macros haya
+            list_frame = tk.Frame(modal, bg="#f7f7f7")
+            list_frame.pack(fill="x", padx=20, pady=(0, 5))
+
+            macros_tree = ttk.Treeview(
+                list_frame,
+                columns=("name",),
+                show="",
+                height=min(7, len(existing_macros)),
+                selectmode="browse",
             )
-            macros_scrollbar = tk.Scrollbar(macros_canvas_frame, orient="vertical", command=macros_canvas.yview)
-            macros_list_frame = tk.Frame(macros_canvas, bg="#f7f7f7")
-
-            macros_list_frame.bind("<Configure>", lambda e: macros_canvas.configure(scrollregion=macros_canvas.bbox("all")))
-            canvas_window = macros_canvas.create_window((0, 0), window=macros_list_frame, anchor="nw")
-            
-            # Ajustar ancho del frame interno al canvas
-            def on_canvas_configure(event):
-                macros_canvas.itemconfig(canvas_window, width=event.width)
-            
-            macros_canvas.bind("<Configure>", on_canvas_configure)
-            macros_canvas.configure(yscrollcommand=macros_scrollbar.set)
-
-            macros_canvas.pack(side="left", fill="both", expand=True)
+            macros_scrollbar = tk.Scrollbar(
+                list_frame, orient="vertical", command=macros_tree.yview
+            )
+            macros_tree.configure(yscrollcommand=macros_scrollbar.set)
+            macros_tree.pack(side="left", fill="x", expand=True)
             macros_scrollbar.pack(side="right", fill="y")
 
-            # Agregar cada macro con botón de eliminar
             for macro_name in existing_macros.keys():
-                macro_row = tk.Frame(macros_list_frame, bg="white", relief="ridge", borderwidth=1)
-                macro_row.pack(fill="x", pady=2, padx=2)
-
-                # Frame para el texto (se expande)
-                text_frame = tk.Frame(macro_row, bg="white")
-                text_frame.pack(side="left", fill="both", expand=True, padx=5, pady=2)
-
-                # Label con el nombre de la macro (truncado)
-                macro_label = tk.Label(
-                    text_frame,
-                    text=macro_name if len(macro_name) <= 30 else macro_name[:27] + "...",
-                    font=("Arial", 9),
-                    bg="white",
-                    anchor="w",
-                    cursor="hand2"
-                )
-                macro_label.pack(fill="x", expand=True)
-
-                # Tooltip para mostrar nombre completo al hacer hover
-                def create_tooltip(widget, text):
-                    tooltip = None
-                    
-                    def on_enter(event):
-                        nonlocal tooltip
-                        if len(text) > 30:  # Solo mostrar si está truncado
-                            x, y, _, _ = widget.bbox("insert")
-                            x += widget.winfo_rootx() + 25
-                            y += widget.winfo_rooty() + 25
-                            
-                            tooltip = tk.Toplevel(widget)
-                            tooltip.wm_overrideredirect(True)
-                            tooltip.wm_geometry(f"+{x}+{y}")
-                            
-                            label = tk.Label(
-                                tooltip,
-                                text=text,
-                                background="lightyellow",
-                                relief="solid",
-                                borderwidth=1,
-                                font=("Arial", 9)
-                            )
-                            label.pack()
-                    
-                    def on_leave(event):
-                        nonlocal tooltip
-                        if tooltip:
-                            tooltip.destroy()
-                            tooltip = None
-                    
-                    widget.bind("<Enter>", on_enter)
-                    widget.bind("<Leave>", on_leave)
-                
-                create_tooltip(macro_label, macro_name)
+                macros_tree.insert("", "end", iid=macro_name, values=(macro_name,))
+
+            # Seleccionar una fila copia el nombre al input
+            def on_macro_select(event):
+                selection = macros_tree.selection()
+                if selection:
+                    name_var.set(selection[0])
+
+            macros_tree.bind("<<TreeviewSelect>>", on_macro_select)
+
+            # Un solo botón de eliminar que actúa sobre la fila seleccionada;
+            # la fila se saca del Treeview en sitio, sin cerrar y reconstruir
+            # el modal completo por cada eliminación
+            def on_delete():
+                selection = macros_tree.selection()
+                if not selection:
+                    messagebox.showwarning(
+                        "Validación", "Seleccione una macro para eliminar."
+                    )
+                    return
+                macro_name = selection[0]
+                if self.delete_macro(mc_data, macro_name):
+                    macros_tree.delete(macro_name)
+                    if name_var.get() == macro_name:
+                        name_var.set("")
 
-                # Click para seleccionar
-                def select_macro(name):
-                    name_var.set(name)
-                
-                macro_label.bind("<Button-1>", lambda e, name=macro_name: select_macro(name))
-
-                # Botón eliminar (alineado a la derecha)
-                def on_delete():
-                    if self.delete_macro(mc_data, macro_name, lambda: [modal.destroy(), self.save_macro()]):
-                        pass 
-
-                delete_btn = tk.Button(
-                    macro_row,
-                    text="🗑️",
-                    font=("Arial", 10),
-                    bg="#e74c3c",
-                    fg="white",
-                    width=3,
-                    command=on_delete
-                )
-                delete_btn.pack(side="right", padx=5, pady=2)
+            delete_btn = tk.Button(
+                modal,
+                text="🗑️ Eliminar seleccionada",
+                font=("Arial", 9),
+                bg="#e74c3c",
+                fg="white",
+                command=on_delete
+            )
+            delete_btn.pack(anchor="e", padx=20, pady=(0, 5))
 
 
         # Frame para botones
@@ -1998,17 +2301,18 @@ class McControlApp:
             # Construir last_state actual
             current_last_state = {}
             for cmd_name in command_configs.keys():
-                cmd_state = self.commands_state.get(cmd_name, {})
-                current_last_state[cmd_name] = cmd_state.get("state", "")
-                
+                cmd_state = self.commands_state.get(cmd_name)
+                current_last_state[cmd_name] = cmd_state.state if cmd_state else ""
+
                 # Guardar repeticiones si aplica
-                base_cmd = cmd_name.split('#')[0] if '#' in cmd_name else cmd_name
-                if base_cmd in ["X_02_TestTrigger", "X_03_RO_Single"] and "repetitions" in cmd_state:
-                    current_last_state[f"{cmd_name}_reps"] = cmd_state["repetitions"].get()
-                
+                base_cmd = cmd_name.partition('#')[0]
+                if (base_cmd in ["X_02_TestTrigger", "X_03_RO_Single"]
+                        and cmd_state and cmd_state.repetitions is not None):
+                    current_last_state[f"{cmd_name}_reps"] = cmd_state.repetitions.get()
+
                 # Guardar delta_time individual
-                if "delta_time" in cmd_state:
-                    current_last_state[f"{cmd_name}_delta"] = cmd_state["delta_time"].get()
+                if cmd_state and cmd_state.delta_time is not None:
+                    current_last_state[f"{cmd_name}_delta"] = cmd_state.delta_time.get()
 
             # Construir datos de la macro
             macro_data = {
@@ -2060,11 +2364,7 @@ class McControlApp:
             return
 
         # Buscar el MC seleccionado
-        mc_data = None
-        for data in self.mc_registered.values():
-            if data.get("mac_destiny") == selected_mc:
-                mc_data = data
-                break
+        _, mc_data = self._lookup_mc(selected_mc)
 
         if not mc_data:
             messagebox.showwarning("Validación", "Micro Controlador no encontrado.")
@@ -2093,146 +2393,46 @@ class McControlApp:
             bg="#f7f7f7"
         ).pack(pady=(20, 10))
 
-        # Frame con scroll para las macros
-        macros_canvas_frame = tk.Frame(modal, bg="#f7f7f7")
-        macros_canvas_frame.pack(fill="both", expand=True, padx=20, pady=10)
-
-        macros_canvas = tk.Canvas(
-            macros_canvas_frame,
-            bg="#f7f7f7",
-            highlightthickness=1,
-            highlightbackground="#ccc"
+        # Lista de macros como Treeview: los ítems viven del lado Tcl y solo
+        # se renderizan las filas visibles, sin un Frame/Label/Button por macro
+        list_frame = tk.Frame(modal, bg="#f7f7f7")
+        list_frame.pack(fill="both", expand=True, padx=20, pady=10)
+
+        macros_tree = ttk.Treeview(
+            list_frame,
+            columns=("name",),
+            show="",
+            height=min(12, len(macros)),
+            selectmode="browse",
         )
-        macros_scrollbar = tk.Scrollbar(macros_canvas_frame, orient="vertical", command=macros_canvas.yview)
-        macros_list_frame = tk.Frame(macros_canvas, bg="#f7f7f7")
-
-        macros_list_frame.bind("<Configure>", lambda e: macros_canvas.configure(scrollregion=macros_canvas.bbox("all")))
-        canvas_window = macros_canvas.create_window((0, 0), window=macros_list_frame, anchor="nw")
-        
-        # Ajustar ancho del frame interno al canvas
-        def on_canvas_configure(event):
-            macros_canvas.itemconfig(canvas_window, width=event.width)
-        
-        macros_canvas.bind("<Configure>", on_canvas_configure)
-        macros_canvas.configure(yscrollcommand=macros_scrollbar.set)
-
-        macros_canvas.pack(side="left", fill="both", expand=True)
+        macros_scrollbar = tk.Scrollbar(list_frame, orient="vertical", command=macros_tree.yview)
+        macros_tree.configure(yscrollcommand=macros_scrollbar.set)
+        macros_tree.pack(side="left", fill="both", expand=True)
         macros_scrollbar.pack(side="right", fill="y")
 
-        # Variable para almacenar la macro seleccionada
-        selected_macro = tk.StringVar()
-
-        # Lista para mantener referencias de todas las filas
-        macro_rows_widgets = []
-
-        # Agregar cada macro con botón de eliminar
+        # El nombre de la macro es el iid: la selección ya entrega el nombre
         for macro_name in macros.keys():
-            macro_row = tk.Frame(macros_list_frame, bg="white", relief="ridge", borderwidth=1)
-            macro_row.pack(fill="x", pady=2, padx=2)
-
-            # Frame para el texto (se expande)
-            text_frame = tk.Frame(macro_row, bg="white")
-            text_frame.pack(side="left", fill="both", expand=True, padx=5, pady=2)
-
-            # Label con el nombre de la macro (truncado)
-            macro_label = tk.Label(
-                text_frame,
-                text=macro_name if len(macro_name) <= 30 else macro_name[:27] + "...",
-                font=("Arial", 9),
-                bg="white",
-                anchor="w",
-                cursor="hand2"
-            )
-            macro_label.pack(fill="x", expand=True)
-
-            # Guardar referencias de widgets de esta fila
-            macro_rows_widgets.append({
-                "row": macro_row,
-                "frame": text_frame,
-                "label": macro_label
-            })
-
-            # Tooltip para mostrar nombre completo al hacer hover
-            def create_tooltip(widget, text):
-                tooltip = None
-                
-                def on_enter(event):
-                    nonlocal tooltip
-                    if len(text) > 30:
-                        x, y, _, _ = widget.bbox("insert")
-                        x += widget.winfo_rootx() + 25
-                        y += widget.winfo_rooty() + 25
-                        
-                        tooltip = tk.Toplevel(widget)
-                        tooltip.wm_overrideredirect(True)
-                        tooltip.wm_geometry(f"+{x}+{y}")
-                        
-                        label = tk.Label(
-                            tooltip,
-                            text=text,
-                            background="lightyellow",
-                            relief="solid",
-                            borderwidth=1,
-                            font=("Arial", 9)
-                        )
-                        label.pack()
-                
-                def on_leave(event):
-                    nonlocal tooltip
-                    if tooltip:
-                        tooltip.destroy()
-                        tooltip = None
-                
-                widget.bind("<Enter>", on_enter)
-                widget.bind("<Leave>", on_leave)
-            
-            create_tooltip(macro_label, macro_name)
-
-            # Click para seleccionar
-            def select_macro_fn(name, current_row, current_frame, current_label):
-                selected_macro.set(name)
-                
-                # Restaurar color de TODAS las filas
-                for widgets in macro_rows_widgets:
-                    widgets["row"].config(bg="white")
-                    widgets["frame"].config(bg="white")
-                    widgets["label"].config(bg="white")
-                
-                # Aplicar color de selección a la fila actual
-                current_row.config(bg="#e3f2fd")
-                current_frame.config(bg="#e3f2fd")
-                current_label.config(bg="#e3f2fd")
-            
-            # Bind con argumentos correctos usando valores actuales del loop
-            macro_label.bind("<Button-1>", lambda e, n=macro_name, r=macro_row, f=text_frame, l=macro_label: select_macro_fn(n, r, f, l))
-            text_frame.bind("<Button-1>", lambda e, n=macro_name, r=macro_row, f=text_frame, l=macro_label: select_macro_fn(n, r, f, l))
-            macro_row.bind("<Button-1>", lambda e, n=macro_name, r=macro_row, f=text_frame, l=macro_label: select_macro_fn(n, r, f, l))
-
-            # Botón eliminar
-            def on_delete(name):
-                if self.delete_macro(mc_data, name, lambda: [modal.destroy(), self.load_macro()]):
-                    pass
-
-            delete_btn = tk.Button(
-                macro_row,
-                text="🗑️",
-                font=("Arial", 10),
-                bg="#e74c3c",
-                fg="white",
-                width=3,
-                command=lambda name=macro_name: on_delete(name)
-            )
-            delete_btn.pack(side="right", padx=5, pady=2)
-
+            macros_tree.insert("", "end", iid=macro_name, values=(macro_name,))
 
         btn_frame = tk.Frame(modal, bg="#f7f7f7")
         btn_frame.pack(pady=(10, 20))
 
+        def on_delete():
+            selection = macros_tree.selection()
+            if not selection:
+                messagebox.showwarning("Validación", "Debe seleccionar una macro.")
+                return
+            macro_name = selection[0]
+            if self.delete_macro(mc_data, macro_name):
+                # Quitar solo la fila, sin reconstruir el modal
+                macros_tree.delete(macro_name)
+
         def cargar():
-            macro_name = selected_macro.get()
-            if not macro_name:
+            selection = macros_tree.selection()
+            if not selection:
                 messagebox.showwarning("Validación", "Debe seleccionar una macro.")
                 return
+            macro_name = selection[0]
 
             if macro_name not in macros:
                 messagebox.showerror("Error", "La macro seleccionada ya no existe.")
@@ -2258,6 +2458,17 @@ class McControlApp:
         )
         cargar_btn.pack(side="left", padx=10)
 
+        eliminar_btn = tk.Button(
+            btn_frame,
+            text="🗑️ Eliminar",
+            font=("Arial", 10, "bold"),
+            bg="#e74c3c",
+            fg="white",
+            command=on_delete,
+            width=10
+        )
+        eliminar_btn.pack(side="left", padx=10)
+
         cancelar_btn = tk.Button(
             btn_frame,
             text="Cancelar",
@@ -2316,30 +2527,20 @@ class McControlApp:
             return
 
         # Buscar el MC seleccionado
-        mc_key = None
-        mc_data = None
-        for key, data in self.mc_registered.items():
-            if data.get("mac_destiny") == selected_mc:
-                mc_key = key
-                mc_data = data
-                break
+        mc_key, mc_data = self._lookup_mc(selected_mc)
         if not mc_data:
             messagebox.showwarning("Validación", "Micro Controlador no encontrado.")
             return
 
         # Universo de comandos
         all_commands = list(self.command_configs.keys())
-        # Contar instancias actuales de cada comando
-        current_commands = list(mc_data.get("command_configs", {}).keys())
-        command_counts = {}
+        # Contar instancias actuales de cada comando en una sola pasada
+        # (las keys con sufijo "#N" cuentan para su comando base)
+        command_counts = collections.Counter(
+            key.partition('#')[0] for key in mc_data.get("command_configs", {})
+        )
         for cmd in all_commands:
-            # Contar instancias: buscar keys que sean exactamente cmd o que empiecen con "cmd#"
-            count = 0
-            for key in current_commands:
-                base_cmd = key.split('#')[0] if '#' in key else key
-                if base_cmd == cmd:
-                    count += 1
-            command_counts[cmd] = count
+            command_counts.setdefault(cmd, 0)
 
         modal = tk.Toplevel(self.root)
         modal.title("Gestionar Comandos")
@@ -2353,34 +2554,24 @@ class McControlApp:
         
         tk.Label(modal, text="Gestionar comandos del microcontrolador", font=("Arial", 12, "bold"), bg="#f7f7f7").pack(pady=(20, 10))
 
-       # Frame con scroll para la lista de comandos
-        canvas_frame = tk.Frame(modal, bg="#f7f7f7")
-        canvas_frame.pack(fill="both", expand=True, padx=20, pady=10)
-
-        canvas = tk.Canvas(canvas_frame, bg="#f7f7f7", highlightthickness=0)
-        scrollbar = tk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
-        cb_frame = tk.Frame(canvas, bg="#f7f7f7")
-
-        cb_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=cb_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        # Encabezado con seleccionar todos (fuera del área con scroll)
+        header_frame = tk.Frame(modal, bg="#f7f7f7")
+        header_frame.pack(fill="x", padx=20)
 
-        # Variables para los checkboxes e instancias
+        # Variables para los checkboxes e instancias: los estados de selección
+        # son bools planos, sin un BooleanVar (variable Tcl) por comando
         command_vars = {}
         instance_vars = {}
+        check_marks = {}
 
-        # Checkbox seleccionar/deseleccionar todos
         select_all_var = tk.BooleanVar(value=False)
+
         def toggle_all():
             value = select_all_var.get()
-            for var in command_vars.values():
-                var.set(value)
-
-        header_frame = tk.Frame(cb_frame, bg="#f7f7f7")
-        header_frame.pack(fill="x", pady=(0, 8))
+            state = "normal" if value else "hidden"
+            for cmd_name in command_vars:
+                command_vars[cmd_name] = value
+                canvas.itemconfigure(check_marks[cmd_name], state=state)
 
         select_all_cb = tk.Checkbutton(
             header_frame,
@@ -2396,29 +2587,60 @@ class McControlApp:
 
         tk.Label(header_frame, text="Instancias", font=("Arial", 10, "bold"), bg="#f7f7f7").grid(row=0, column=1, padx=(10, 0))
 
-        # Listado de comandos con checkboxes e inputs de instancias
-        for cmd_name in all_commands:
-            var = tk.BooleanVar(value=command_counts[cmd_name] > 0)
-            command_vars[cmd_name] = var
-            
+        # Lista dibujada sobre un único Canvas: cada checkbox es un par de
+        # items (rectángulo + ✓) en vez de un Checkbutton empaquetado por
+        # comando, así abrir el modal no dispara un reflow por fila
+        canvas_frame = tk.Frame(modal, bg="#f7f7f7")
+        canvas_frame.pack(fill="both", expand=True, padx=20, pady=10)
+
+        canvas = tk.Canvas(canvas_frame, bg="#f7f7f7", highlightthickness=0)
+        scrollbar = tk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
+        canvas.configure(yscrollcommand=scrollbar.set)
+
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        row_height = 30
+        for idx, cmd_name in enumerate(all_commands):
+            y = idx * row_height + row_height // 2
+            selected = command_counts[cmd_name] > 0
+            command_vars[cmd_name] = selected
+
             instance_var = tk.IntVar(value=max(1, command_counts[cmd_name]))
             instance_vars[cmd_name] = instance_var
 
-            row_frame = tk.Frame(cb_frame, bg="#f7f7f7")
-            row_frame.pack(fill="x", pady=2)
-
-            cb = tk.Checkbutton(row_frame, text=cmd_name, variable=var, anchor="w", bg="#f7f7f7", width=35)
-            cb.grid(row=0, column=0, sticky="w")
+            canvas.create_rectangle(8, y - 7, 22, y + 7, outline="#555555", fill="white")
+            check_marks[cmd_name] = canvas.create_text(
+                15, y, text="✓", font=("Arial", 10, "bold"),
+                state="normal" if selected else "hidden"
+            )
+            canvas.create_text(32, y, text=cmd_name, anchor="w", font=("Arial", 10))
 
             spinbox = tk.Spinbox(
-                row_frame,
+                canvas,
                 from_=1,
                 to=100,
                 textvariable=instance_var,
                 width=5,
                 justify="center"
             )
-            spinbox.grid(row=0, column=1, padx=(10, 0))
+            canvas.create_window(310, y, window=spinbox)
+
+        canvas.configure(scrollregion=(0, 0, 360, len(all_commands) * row_height))
+
+        def on_canvas_click(event):
+            # Un solo binding para toda la lista: la fila se deduce de la
+            # coordenada vertical, sin un callback por checkbox
+            idx = int(canvas.canvasy(event.y) // row_height)
+            if 0 <= idx < len(all_commands):
+                cmd_name = all_commands[idx]
+                command_vars[cmd_name] = not command_vars[cmd_name]
+                canvas.itemconfigure(
+                    check_marks[cmd_name],
+                    state="normal" if command_vars[cmd_name] else "hidden"
+                )
+
+        canvas.bind("<Button-1>", on_canvas_click)
 
         btn_frame = tk.Frame(modal, bg="#f7f7f7")
         btn_frame.pack(fill="x", pady=(20, 20))
@@ -2428,21 +2650,20 @@ class McControlApp:
             new_command_list = []
             
             for cmd in all_commands:
-                if command_vars[cmd].get():  # Si está seleccionado
+                if command_vars[cmd]:  # Si está seleccionado
                     instances = instance_vars[cmd].get()
                     for _ in range(instances):
                         new_command_list.append(cmd)
             
-            # Construir command_configs manteniendo el orden y permitiendo duplicados
+            # Construir command_configs manteniendo el orden y permitiendo
+            # duplicados; totales y posiciones en una sola pasada
+            totals = collections.Counter(new_command_list)
+            seen = collections.Counter()
             new_command_configs = {}
-            for i, cmd in enumerate(new_command_list):
+            for cmd in new_command_list:
                 # Usar un key único para cada instancia
-                if new_command_list.count(cmd) > 1:
-                    # Contar cuántas veces ya apareció este comando
-                    count_before = new_command_list[:i].count(cmd)
-                    key = f"{cmd}#{count_before + 1}"
-                else:
-                    key = cmd
+                seen[cmd] += 1
+                key = f"{cmd}#{seen[cmd]}" if totals[cmd] > 1 else cmd
                 new_command_configs[key] = self.command_configs[cmd]
             
             mc_data["command_configs"] = new_command_configs
@@ -2452,7 +2673,7 @@ class McControlApp:
             new_last_state = {}
             for key in new_command_configs.keys():
                 # Extraer el comando base (sin el #N)
-                base_cmd = key.split('#')[0] if '#' in key else key
+                base_cmd = key.partition('#')[0]
                 # Si ya existía un estado para este comando, mantenerlo
                 if key in last_state:
                     new_last_state[key] = last_state[key]
@@ -2499,11 +2720,11 @@ class McControlApp:
     def toggle_command_state(self, cmd_name, state):
         """Maneja el toggle de botones ON/OFF/HIGH/LOW/GLOBAL/LOCAL para cada comando"""
         cmd_state = self.commands_state[cmd_name]
-        on_btn = cmd_state["on_btn"]
-        off_btn = cmd_state.get("off_btn")  # Puede ser None
+        on_btn = cmd_state.on_btn
+        off_btn = cmd_state.off_btn  # Puede ser None
 
         # Obtener las keys del comando
-        base_cmd = cmd_name.split('#')[0] if '#' in cmd_name else cmd_name
+        base_cmd = cmd_name.partition('#')[0]
         btn_keys = list(self.command_configs[base_cmd].keys())
         btn1_text = btn_keys[0] if len(btn_keys) > 0 else "ON"
         btn2_text = btn_keys[1] if len(btn_keys) > 1 else "OFF"
@@ -2512,15 +2733,15 @@ class McControlApp:
         single_button_commands = ["X_FF_Reset", "X_02_TestTrigger", "X_03_RO_Single"]
 
         # Si presiona el mismo botón que ya está activo, desactivarlo
-        if cmd_state["state"] == state:
-            cmd_state["state"] = None
+        if cmd_state.state == state:
+            cmd_state.state = None
             on_btn.config(bg="#e0e0e0", relief="raised")
             if off_btn:
                 off_btn.config(bg="#e0e0e0", relief="raised")
             self.add_response(f"🔘 {cmd_name}: Desactivado")
         else:
             # Activar el botón presionado
-            cmd_state["state"] = state
+            cmd_state.state = state
 
             if state == btn1_text:  # Botón 1 (ON/HIGH/GLOBAL)
                 on_btn.config(bg="#27ae60", relief="sunken")
@@ -2545,81 +2766,69 @@ class McControlApp:
             )
             return
         
+        # Buscar el MC seleccionado una sola vez (MAC origen, datos e interfaz)
+        mac_origen, mc_data = self._lookup_mc(selected_mc)
+        interface = mc_data.get("interface_destiny") if mc_data else None
+
+        if not mac_origen or not interface:
+            messagebox.showwarning("Validación", "MC no está registrado correctamente")
+            return
+
         # Guardar estados en el MC seleccionado
-        for mc_key, mc_data in self.mc_registered.items():
-            if mc_data.get("mac_destiny") == selected_mc:
-                command_configs = mc_data.get("command_configs", {})
-                last_state = {}
-                
-                # Comandos automáticos
-                auto_commands = ["X_FF_Reset", "X_02_TestTrigger", "X_03_RO_Single"]
-                repeatable_commands = ["X_02_TestTrigger", "X_03_RO_Single"]
-                
-                for cmd_name in command_configs.keys():
-                    base_cmd = cmd_name.split('#')[0] if '#' in cmd_name else cmd_name
-                    cmd_state = self.commands_state.get(cmd_name, {})
-                    
-                    # Para comandos automáticos, guardar "ON" si está enabled
-                    if base_cmd in auto_commands:
-                        if cmd_state.get("enabled", tk.BooleanVar()).get():
-                            last_state[cmd_name] = "ON"
-                        else:
-                            last_state[cmd_name] = ""
-                    else:
-                        # Para comandos normales, guardar el estado seleccionado
-                        last_state[cmd_name] = cmd_state.get("state", "")
-                    
-                    # Guardar repeticiones si aplica
-                    if base_cmd in repeatable_commands and "repetitions" in cmd_state:
-                        last_state[f"{cmd_name}_reps"] = cmd_state["repetitions"].get()
-                    
-                    # Guardar delta_time individual
-                    if "delta_time" in cmd_state:
-                        last_state[f"{cmd_name}_delta"] = cmd_state["delta_time"].get()
-                
-                mc_data["last_state"] = last_state
-                break
+        command_configs = mc_data.get("command_configs", {})
+        last_state = {}
 
-        self.update_db_stats()
+        # Comandos automáticos
 
-        # Obtener MAC origen e interfaz
-        mac_origen = None
-        interface = None
+        for cmd_name in command_configs.keys():
+            base_cmd = cmd_name.partition('#')[0]
+            cmd_state = self.commands_state.get(cmd_name)
 
-        for mac_src, data in self.mc_registered.items():
-            if data.get("mac_destiny") == selected_mc:
-                mac_origen = mac_src
-                interface = data.get("interface_destiny")
-                break
+            # Para comandos automáticos, guardar "ON" si está enabled
+            if base_cmd in _AUTO_COMMANDS:
+                if self._cmd_enabled(cmd_name):
+                    last_state[cmd_name] = "ON"
+                else:
+                    last_state[cmd_name] = ""
+            else:
+                # Para comandos normales, guardar el estado seleccionado
+                last_state[cmd_name] = cmd_state.state if cmd_state else ""
 
-        if not mac_origen or not interface:
-            messagebox.showwarning("Validación", "MC no está registrado correctamente")
-            return
+            # Guardar repeticiones si aplica
+            if (base_cmd in _REPEATABLE_COMMANDS
+                    and cmd_state and cmd_state.repetitions is not None):
+                last_state[f"{cmd_name}_reps"] = cmd_state.repetitions.get()
+
+            # Guardar delta_time individual
+            if cmd_state and cmd_state.delta_time is not None:
+                last_state[f"{cmd_name}_delta"] = cmd_state.delta_time.get()
+
+        mc_data["last_state"] = last_state
+
+        self.update_db_stats()
 
         # Comandos automáticos
-        auto_commands = ["X_FF_Reset", "X_02_TestTrigger", "X_03_RO_Single"]
         # Comandos que se pueden repetir
-        repeatable_commands = ["X_02_TestTrigger", "X_03_RO_Single"]
     
         # Recolectar comandos habilitados en el orden visual
         commands_to_send = []
         for row in self.command_rows:
             cmd_name = row["cmd_name"]
             cmd_state = self.commands_state[cmd_name]
-            base_cmd = cmd_name.split('#')[0] if '#' in cmd_name else cmd_name
+            base_cmd = cmd_name.partition('#')[0]
             
             # Obtener delta_time individual (default 1.0)
-            delta_time = cmd_state.get("delta_time", tk.DoubleVar(value=1.0)).get()
+            delta_time = cmd_state.delta_time.get() if cmd_state.delta_time is not None else 1.0
             
             # Para comandos automáticos, solo verificar si está enabled
-            if base_cmd in auto_commands:
-                if cmd_state["enabled"].get():
+            if base_cmd in _AUTO_COMMANDS:
+                if self._cmd_enabled(cmd_name):
                     appendix_key = self.command_configs[base_cmd]["ON"]
                     
                     # Obtener número de repeticiones si aplica
                     repetitions = 1
-                    if base_cmd in repeatable_commands and "repetitions" in cmd_state:
-                        repetitions = cmd_state["repetitions"].get()
+                    if base_cmd in _REPEATABLE_COMMANDS and cmd_state.repetitions is not None:
+                        repetitions = cmd_state.repetitions.get()
                     
                     commands_to_send.append(
                         {
@@ -2632,12 +2841,12 @@ class McControlApp:
                     )
             else:
                 # Para comandos normales, verificar enabled y state
-                if cmd_state["enabled"].get() and cmd_state["state"]:
-                    appendix_key = self.command_configs[base_cmd][cmd_state["state"]]
+                if self._cmd_enabled(cmd_name) and cmd_state.state:
+                    appendix_key = self.command_configs[base_cmd][cmd_state.state]
                     commands_to_send.append(
                         {
                             "name": cmd_name,
-                            "state": cmd_state["state"],
+                            "state": cmd_state.state,
                             "appendix_key": appendix_key,
                             "repetitions": 1,
                             "delta_time": delta_time,
@@ -2672,97 +2881,113 @@ class McControlApp:
         self.add_response("=" * 50)
         self.add_response(f"📡 Enviando {len(commands_to_send)} comando(s)")
 
-        # Enviar comandos con delay
-        def send_all():
-            cmd_index = 1
-            total_commands = sum(c["repetitions"] for c in commands_to_send)
-            
-            for cmd_info in commands_to_send:
-                repetitions = cmd_info["repetitions"]
-                delta_time = cmd_info["delta_time"]
-                
-                for rep in range(repetitions):
-                    # Verificar cancelación
-                    if self.cancel_sending:
-                        self.add_response(f"⚠️ Envío cancelado después de {cmd_index-1}/{total_commands} comandos")
-                        break
-                    
-                    # Mostrar número de repetición si aplica
-                    rep_info = f" (rep {rep+1}/{repetitions})" if repetitions > 1 else ""
-                    send_command_packet(cmd_info, cmd_index, total_commands, rep_info)
-                    cmd_index += 1
-                    
-                    # Esperar delta_time después de CADA envío (incluso entre repeticiones)
-                    # Verificar cancelación durante el delay
-                    delay_cancelled = False
-                    for _ in range(int(delta_time * 10)):
-                        if self.cancel_sending:
-                            self.add_response(f"⚠️ Envío cancelado después de {cmd_index-1}/{total_commands} comandos")
-                            delay_cancelled = True
-                            break
-                        time.sleep(0.1)
-                    
-                    if delay_cancelled:
-                        break
-                
-                # Si se canceló, salir del loop principal
-                if self.cancel_sending:
-                    break
+        # Aplanar los comandos en pasos programables con after(); una ráfaga
+        # sin delay (todas las repeticiones en un sendmmsg) es un solo paso
+        send_steps = []
+        for cmd_info in commands_to_send:
+            if cmd_info["repetitions"] > 1 and cmd_info["delta_time"] == 0:
+                send_steps.append((cmd_info, None))
+            else:
+                for rep in range(cmd_info["repetitions"]):
+                    send_steps.append((cmd_info, rep))
+
+        total_commands = sum(c["repetitions"] for c in commands_to_send)
+
+        # Resolver las referencias invariantes del envío una sola vez: los
+        # closures de abajo las leen como locales en vez de atributos/globales
+        get_frame = self.get_frame
+        get_l2_socket = self.get_l2_socket
+        add_response = self.add_response
+
+        def send_command_packet(cmd_info, index, total, rep_info=""):
+            """Envía un paquete individual"""
+            try:
+                # Enviar la trama precalculada con el socket cacheado
+                frame = get_frame(mac_origen, selected_mc, cmd_info["appendix_key"])
+                get_l2_socket(interface).send(frame)
+
+                add_response(
+                    f"✓ [{index}/{total}] {cmd_info['appendix_key']}{rep_info} enviado"
+                )
 
+            except Exception as e:
+                add_response(f"✗ Error en {cmd_info['appendix_key']}: {str(e)}")
+
+        def finish_sending():
             if not self.cancel_sending:
                 self.add_response("✓ Todos los comandos enviados")
-            
+
             self.add_response("=" * 50)
-            
+
             # Restaurar botón
             self.sending_commands = False
             self.cancel_sending = False
             self.send_commands_btn.config(text="Enviar Comandos", bg="#3498db")
-        
-        def send_command_packet(cmd_info, index, total, rep_info=""):
-            """Envía un paquete individual"""
-            try:
-                appendix = appendix_dict.get(cmd_info["appendix_key"])
-
-                # Construir paquete
-                mac_origen_bytes = bytes.fromhex(mac_origen.replace(":", ""))
-                mac_destino_bytes = bytes.fromhex(selected_mc.replace(":", ""))
-                payload_length = 7
-                length_bytes = payload_length.to_bytes(2, byteorder="big")
-                padding_bytes = b"\x00\x00\x00\x00"
-                constant_bytes = b"\x02\x03"
-
-                packet = (
-                    mac_destino_bytes
-                    + mac_origen_bytes
-                    + length_bytes
-                    + padding_bytes
-                    + constant_bytes
-                    + appendix
-                )
 
-                # Enviar
-                scapy_packet = Raw(load=packet)
-                sendp(scapy_packet, iface=interface, verbose=False)
+        def send_tick(step, cmd_index):
+            """Envía un paso y se reprograma con after() hasta agotar la lista
 
-                self.add_response(
-                    f"✓ [{index}/{total}] {cmd_info['appendix_key']}{rep_info} enviado"
-                )
+            Correr sobre el loop de eventos de Tk evita el thread de fondo con
+            time.sleep() y los saltos entre threads para actualizar la UI.
+            """
+            if self.cancel_sending:
+                self.add_response(f"⚠️ Envío cancelado después de {cmd_index-1}/{total_commands} comandos")
+                finish_sending()
+                return
 
-            except Exception as e:
-                self.add_response(f"✗ Error en {cmd_info['appendix_key']}: {str(e)}")
+            if step >= len(send_steps):
+                finish_sending()
+                return
 
-        # Ejecutar en thread
-        threading.Thread(target=send_all, daemon=True).start()
+            cmd_info, rep = send_steps[step]
+            repetitions = cmd_info["repetitions"]
+
+            if rep is None:
+                # Ráfaga sin delay: entregar todas las repeticiones al kernel
+                # en una sola llamada al sistema en vez de un send() por trama
+                try:
+                    frame = get_frame(mac_origen, selected_mc, cmd_info["appendix_key"])
+                    sent = send_frames_batch(
+                        get_l2_socket(interface), [frame] * repetitions
+                    )
+                    cmd_index += sent
+                    add_response(
+                        f"✓ [{cmd_index-1}/{total_commands}] {cmd_info['appendix_key']} "
+                        f"(ráfaga de {sent}) enviado"
+                    )
+                except Exception as e:
+                    add_response(f"✗ Error en {cmd_info['appendix_key']}: {str(e)}")
+                    cmd_index += repetitions
+            else:
+                # Mostrar número de repetición si aplica
+                rep_info = f" (rep {rep+1}/{repetitions})" if repetitions > 1 else ""
+                send_command_packet(cmd_info, cmd_index, total_commands, rep_info)
+                cmd_index += 1
+
+            # Esperar delta_time antes del siguiente paso sin bloquear la UI
+            delay_ms = max(int(cmd_info["delta_time"] * 1000), 1)
+            self.root.after(delay_ms, lambda: send_tick(step + 1, cmd_index))
+
+        send_tick(0, 1)
 
     def refresh_mc_list(self):
         """Actualiza la lista de interfaces ethernet conectadas y sus MACs"""
 
         # Limpiar datos previos
         self.mc_available = {}
-
-        interfaces = psutil.net_if_addrs()
-        stats = psutil.net_if_stats()
+        self._mc_display_cache = None
+
+        # Reutilizar la consulta a psutil si es reciente: net_if_addrs()
+        # construye un dict de direcciones por interfaz en cada llamada y este
+        # método puede dispararse varias veces por refresco de la UI
+        now = time.monotonic()
+        ts, addrs_cached, stats_cached = self._netif_cache
+        if addrs_cached is not None and now - ts < 1.0:
+            interfaces, stats = addrs_cached, stats_cached
+        else:
+            interfaces = psutil.net_if_addrs()
+            stats = psutil.net_if_stats()
+            self._netif_cache = (now, interfaces, stats)
 
         for iface_name, addrs in interfaces.items():
             # Filtros básicos
@@ -2803,15 +3028,29 @@ class McControlApp:
         self.frames_sent_label.config(text=str(len(self.mc_available)))
 
     def get_mc_display_list(self):
-        """Retorna lista formateada de MCs registrados: label | mac"""
+        """Retorna lista formateada de MCs registrados: label | mac
+
+        El resultado se cachea y solo se rearma cuando cambian los MCs
+        disponibles o registrados.
+        """
+        if self._mc_display_cache is not None:
+            return self._mc_display_cache
+
         display_list = []
+        display_by_mac = {}
         for mac_origen in self.mc_available.keys():
-            if mac_origen in self.mc_registered:
-                label = self.mc_registered[mac_origen].get("label", "Sin etiqueta")
-                mac_destino = self.mc_registered[mac_origen].get("mac_destiny", "N/A")
-                display_list.append(f"{label} | {mac_destino}")
+            mac_key = mac_to_bytes(mac_origen)
+            if mac_key in self.mc_registered:
+                label = self.mc_registered[mac_key].get("label", "Sin etiqueta")
+                mac_destino = self.mc_registered[mac_key].get("mac_destiny", "N/A")
+                display = f"{label} | {mac_destino}"
+                display_list.append(display)
+                display_by_mac[mac_destino] = display
             else:
                 display_list.append(f"No registrado")
+
+        self._mc_display_cache = display_list
+        self._mc_display_by_mac = display_by_mac
         return display_list
 
     def get_mac_from_selection(self, selection):
@@ -2820,6 +3059,17 @@ class McControlApp:
             return selection.split(" | ")[1]
         return None
 
+    def _lookup_mc(self, mac_destiny):
+        """Resuelve un MC registrado por su MAC destino vía el índice inverso
+
+        Returns:
+            (mac_key, data) del MC registrado, o (None, None) si no existe
+        """
+        mac_key = self._by_mac_dst.get(mac_destiny)
+        if mac_key is None or mac_key not in self.mc_registered:
+            return None, None
+        return mac_key, self.mc_registered[mac_key]
+
     def refresh_dashboard_mc_table(self):
         """Refresca la lista y tabla de micro controladores en el dashboard"""
         self.refresh_mc_list()
@@ -2835,24 +3085,53 @@ class McControlApp:
         for row in self.mc_table.get_children():
             self.mc_table.delete(row)
 
-        # Insertar datos actualizados
+        # Insertar datos actualizados (recordando el item de cada MAC para
+        # poder actualizar filas individuales sin reconstruir la tabla)
+        self._mc_table_rows = {}
         for mac_source, interfaz in self.mc_available.items():
-            if mac_source in self.mc_registered:
-                mac_destiny = self.mc_registered[mac_source].get("mac_destiny", "N/A")
-                interface_destiny = self.mc_registered[mac_source].get(
-                    "interface_destiny", "N/A"
-                )
-                label = self.mc_registered[mac_source].get("label", "Sin Label")
-            else:
-                mac_destiny = "No registrado"
-                interface_destiny = "N/A"
-                label = "N/A"
-
-            self.mc_table.insert(
+            self._mc_table_rows[mac_source] = self.mc_table.insert(
                 "",
                 "end",
-                values=(interfaz, mac_source, mac_destiny, interface_destiny, label),
+                values=self._dashboard_mc_row_values(mac_source, interfaz),
+            )
+
+    def _dashboard_mc_row_values(self, mac_source, interfaz):
+        """Arma la tupla de valores de una fila de la tabla de MCs"""
+        mac_key = mac_to_bytes(mac_source)
+        if mac_key in self.mc_registered:
+            mac_destiny = self.mc_registered[mac_key].get("mac_destiny", "N/A")
+            interface_destiny = self.mc_registered[mac_key].get(
+                "interface_destiny", "N/A"
             )
+            label = self.mc_registered[mac_key].get("label", "Sin Label")
+        else:
+            mac_destiny = "No registrado"
+            interface_destiny = "N/A"
+            label = "N/A"
+        return (interfaz, mac_source, mac_destiny, interface_destiny, label)
+
+    def update_dashboard_mc_row(self, mac_source):
+        """Actualiza en sitio la fila del dashboard de una MAC de origen
+
+        Registrar un MC cambia una sola fila: actualizarla directamente es
+        O(1) y evita el refresh completo, que borra y reinserta todas las
+        filas del Treeview además de re-escanear las interfaces de red.
+        """
+        iid = getattr(self, "_mc_table_rows", {}).get(mac_source)
+        if iid is None:
+            # Fila desconocida (tabla aún no construida o MAC nueva):
+            # caer al refresh completo
+            self.refresh_dashboard_mc_table()
+            return
+
+        interfaz = self.mc_available.get(mac_source, "N/A")
+        self.mc_table.item(
+            iid, values=self._dashboard_mc_row_values(mac_source, interfaz)
+        )
+
+        # El combo de la pestaña de comandos sí depende de los registrados
+        if hasattr(self, "mc_combo"):
+            self.mc_combo["values"] = self.get_mc_display_list()
 
     def register_mc(self):
         """Procesa el registro de un micro controlador"""
@@ -2878,23 +3157,38 @@ class McControlApp:
             return
 
         # Validar formato MAC (soporta : y - como separadores)
-        mac_pattern = r"^([0-9a-f]{2}[:-]){5}[0-9a-f]{2}$"
-        if not re.match(mac_pattern, mac_destino):
+        if not _MAC_RE.match(mac_destino):
             messagebox.showerror(
                 "Validación", "Formato de MAC inválido\nUse formato: fe:80:ab:cd:12:34"
             )
             return
 
         # Normalizar formato (usar : como separador)
-        mac_destino = mac_destino.replace("-", ":")
-
-        # Registrar en diccionario
-        self.mc_registered[mac_origen] = {
+        if "-" in mac_destino:
+            mac_destino = mac_destino.replace("-", ":")
+
+        # Registrar en diccionario (key canónica de 6 bytes)
+        mac_key = mac_to_bytes(mac_origen)
+        previous = self.mc_registered.get(mac_key)
+        if previous and previous.get("mac_destiny"):
+            # Descartar la entrada vieja del índice inverso si cambia la MAC destino
+            self._by_mac_dst.pop(previous["mac_destiny"], None)
+        self.mc_registered[mac_key] = {
             "mac_destiny": mac_destino,
             "interface_destiny": interface_destino,
             "label": label if label else "Sin etiqueta",
             "command_configs": dict(self.command_configs)
         }
+        self._by_mac_dst[mac_destino] = mac_key
+
+        # Invalidar la cabecera y tramas precalculadas y la lista formateada de MCs
+        self.frame_prefix_cache.pop(mac_key, None)
+        self.frame_cache.pop(mac_key, None)
+        self._mc_display_cache = None
+        self._dirty_macs.add(mac_key)
+
+        # Persistir el alta de inmediato en el log incremental (O(1) bytes)
+        self._append_mc_log(mac_origen, self.mc_registered[mac_key])
 
         # Limpiar formulario
         self.mac_origen_var.set("Seleccione MAC origen...")
@@ -2902,20 +3196,17 @@ class McControlApp:
         self.interface_destino_var.set("")
         self.label_var.set("")
 
-        # Refrescar tabla
-        self.refresh_dashboard_mc_table()
+        # Actualizar solo la fila afectada (el alta no cambia las interfaces)
+        self.update_dashboard_mc_row(mac_origen)
 
-        try:
-            self.update_db_stats()
-            messagebox.showinfo(
-                "Éxito",
-                f"Micro Controlador registrado:\n{mac_origen} → {mac_destino} ({interface_destino})",
-            )
-        except Exception:
-            messagebox.showinfo(
-                "Error",
-                f"No fue posible asociar el micro controlador:\n{mac_origen} → {mac_destino} ({interface_destino})",
-            )
+        # update_db_stats solo marca el estado como sucio; la escritura real
+        # ocurre en el thread escritor y un fallo de disco se reporta desde
+        # _db_writer_loop vía _notify_db_write_error
+        self.update_db_stats()
+
+        self._set_status(
+            f"Micro Controlador registrado: {mac_origen} → {mac_destino} ({interface_destino})"
+        )
 
     def create_menu(self):
         """Crea el menú principal"""
@@ -2929,35 +3220,129 @@ class McControlApp:
         file_menu.add_command(label="Salir", command=self.root.quit)
 
     def add_response(self, response):
-        """Añade una respuesta al área de texto"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.response_text.insert(tk.END, f"[{timestamp}] {response}\n")
-        self.response_text.see(tk.END)
+        """Encola una respuesta para el área de texto"""
+        # Solo se re-formatea la hora cuando cambia el segundo: evita un
+        # strftime (y la construcción de un datetime) por cada mensaje
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            # Formateo manual: evita el parser de formato y la maquinaria
+            # de locale de strftime para un formato fijo ASCII
+            lt = time.localtime(now)
+            self._last_ts_str = f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+        self._log_queue.append(f"[{self._last_ts_str}] {response}")
+
+    def _drain_log(self):
+        """Vuelca todos los mensajes encolados al área de texto de una sola vez
+
+        Agrupar los mensajes en un único insert + see cada 50 ms evita un
+        redibujado del widget por cada comando enviado durante una ráfaga.
+        """
+        if self._log_queue:
+            messages = []
+            while self._log_queue:
+                messages.append(self._log_queue.popleft())
+            self.response_text.insert(tk.END, "\n".join(messages) + "\n")
+            # Recortar las líneas más viejas para que el costo de insertar
+            # y redibujar se mantenga constante en sesiones largas
+            total_lines = int(self.response_text.index("end-1c").split(".")[0])
+            if total_lines > _MAX_LOG_LINES:
+                self.response_text.delete("1.0", f"{total_lines - _MAX_LOG_LINES}.0")
+            self.response_text.see(tk.END)
+        self.root.after(50, self._drain_log)
 
     # Metodos para la db #
     def update_db_stats(self):
-        """Actualiza o inserta los datos de microcontroladores registrados en db.json"""
-        db_path = db_json
+        """Actualiza los datos de microcontroladores en self.db y marca el guardado pendiente
 
+        La escritura a disco queda a cargo de _flush_db_if_dirty: varias
+        llamadas seguidas (registro + estados + macros) producen un solo
+        write en el próximo tick en vez de reescribir db.json cada vez.
+        """
         # Estructura para guardar
         if not hasattr(self, "db") or not isinstance(self.db, dict):
             self.db = {}
 
-        # Actualiza los datos de microcontroladores registrados
-        self.db["mc_registered"] = self.mc_registered
-        
+        # Sincronizar solo los MCs con entradas nuevas o reemplazadas: los
+        # dicts de cada MC cargado son compartidos con self.db, así que las
+        # mutaciones in-place (last_state, command_configs) ya están ahí y
+        # no hace falta rearmar el mapa completo en cada guardado
+        # (las keys en memoria son bytes; en disco se persisten como strings hex)
+        persisted = self.db.setdefault("mc_registered", {})
+        for mac_key in self._dirty_macs:
+            mac_str = bytes_to_mac(mac_key)
+            if mac_key in self.mc_registered:
+                persisted[mac_str] = self.mc_registered[mac_key]
+            else:
+                persisted.pop(mac_str, None)
+        self._dirty_macs.clear()
+
         # Actualiza las macros universales
         self.db["macros"] = self.macros
-        
+
         # Actualiza las asociaciones de PETs
         self.db["pet_associations"] = self.pet_associations
 
-        # Guarda en disco (sobrescribe)
-        try:
-            with open(db_path, "w", encoding="utf-8") as f:
-                json.dump(self.db, f, indent=4)
-        except Exception as e:
-            print(f"Error al guardar en {db_path}: {e}")
+        self._db_dirty = True
+
+    def _flush_db_if_dirty(self, reschedule=True):
+        """Encola la escritura de db.json si hay cambios pendientes
+
+        La serialización (rápida) ocurre aquí para no compartir self.db entre
+        threads; el write + fsync (lento) lo hace el thread escritor.
+        """
+        if self._db_dirty:
+            self._db_dirty = False
+            try:
+                payload = _json_dumps(self.db)
+            except Exception as e:
+                print(f"Error al serializar la base de datos: {e}")
+            else:
+                # Comparar el hash del payload con el último escrito evita
+                # reescribir db.json cuando el estado no cambió realmente
+                payload_hash = hashlib.blake2b(payload, digest_size=16).digest()
+                if payload_hash != self._last_db_hash:
+                    self._last_db_hash = payload_hash
+                    self._write_queue.put(payload)
+        if reschedule:
+            self.root.after(500, self._flush_db_if_dirty)
+
+    def _db_writer_loop(self):
+        """Drena la cola de payloads y los escribe a disco (reemplazo atómico)"""
+        while True:
+            payload = self._write_queue.get()
+            if payload is None:  # Centinela de cierre
+                break
+            try:
+                write_db_payload(db_json, payload)
+            except Exception as e:
+                print(f"Error al guardar en {db_json}: {e}")
+                # Avisar en el hilo de UI: este es el único punto donde el
+                # guardado puede fallar y el print no le llega al usuario
+                message = f"No fue posible guardar {db_json}: {e}"
+                try:
+                    self.root.after(0, partial(self._notify_db_write_error, message))
+                except tk.TclError:
+                    pass  # Ventana ya destruida durante el cierre
+            else:
+                # El snapshot ya contiene todo lo registrado hasta su
+                # serialización: el log incremental puede truncarse
+                try:
+                    if os.path.exists(db_json_log):
+                        open(db_json_log, "wb").close()
+                except Exception:
+                    pass
+
+    def _notify_db_write_error(self, message):
+        """Muestra en la UI un fallo de escritura de db.json (corre en el hilo de Tk)"""
+        self._set_status(message, level="error")
+        self.add_response(f"✗ {message}")
+
+    def _shutdown_db_writer(self):
+        """Cierra el thread escritor esperando a que la cola quede vacía"""
+        self._write_queue.put(None)
+        # La cola se drena en orden: al salir el centinela ya se escribió todo
+        self._db_writer_thread.join(timeout=5)
 
 
 def main():
@@ -2968,6 +3353,10 @@ def main():
     def on_closing():
         """Maneja el cierre de la aplicación"""
         app.running = False
+        # Asegurar que los cambios pendientes lleguen a disco antes de salir
+        app._flush_db_if_dirty(reschedule=False)
+        app._shutdown_db_writer()
+        app._close_mc_log()
         root.destroy()
 
     root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -10,7 +10,7 @@ import time
 from typing import List, Optional, Callable
 from dataclasses import dataclass
 
-from scapy.all import Ether, Raw, sendp
+from scapy.all import Ether, Raw, conf, sendp
 
 
 @dataclass
@@ -37,12 +37,93 @@ class PacketSender:
     PAYLOAD_LENGTH = 7
     PADDING_BYTES = b"\x00\x00\x00\x00"
     CONSTANT_BYTES = b"\x02\x03"
+    # Fixed tail of the frame header (length + padding + constants),
+    # assembled once at class definition time
+    HEADER_TAIL = PAYLOAD_LENGTH.to_bytes(2, byteorder="big") + PADDING_BYTES + CONSTANT_BYTES
 
     def __init__(self):
         """Initialize the PacketSender."""
         self.sending = False
         self.cancel_flag = False
         self._lock = threading.Lock()
+        # Cache of precomputed frame headers keyed by (mac_source, mac_destiny).
+        # Converting MAC strings to bytes and concatenating the fixed header
+        # is pure overhead when the same MC is targeted thousands of times.
+        self._header_cache = {}
+        # Cache of complete frames keyed by (mac_source, mac_destiny,
+        # command_byte): bursts resend identical 21-byte frames, so even the
+        # final header + command concatenation can be done once.
+        self._frame_cache = {}
+        # Cache of open Layer 2 sockets keyed by interface name. Without it,
+        # Scapy opens and closes a raw socket on every sendp() call.
+        self._l2_sockets = {}
+
+    def _get_l2_socket(self, interface: str):
+        """
+        Get a cached Layer 2 socket for the given interface.
+
+        Opens the socket on first use and reuses it for subsequent sends,
+        avoiding the per-packet socket open/close that sendp() performs
+        when no socket is supplied.
+
+        Args:
+            interface: Network interface name (e.g., "eth0")
+
+        Returns:
+            The cached Scapy L2 socket, or None if the socket could not be
+            opened (e.g., missing privileges); sendp() then falls back to
+            its own temporary socket.
+        """
+        sock = self._l2_sockets.get(interface)
+        if sock is None:
+            try:
+                sock = conf.L2socket(iface=interface)
+            except Exception:
+                return None
+            self._l2_sockets[interface] = sock
+        return sock
+
+    def close(self) -> None:
+        """Close all cached Layer 2 sockets."""
+        for sock in self._l2_sockets.values():
+            try:
+                sock.close()
+            except Exception:
+                pass
+        self._l2_sockets.clear()
+
+    def _get_frame_header(self, mac_source: str, mac_destiny: str) -> bytes:
+        """
+        Get the precomputed frame header for a source/destination MAC pair.
+
+        The header covers everything before the command byte:
+        destination MAC + source MAC + length + padding + constants (20 bytes).
+        Results are cached so repeated sends to the same MC skip the
+        hex-string parsing and concatenation entirely.
+
+        Args:
+            mac_source: Source MAC address (e.g., "aa:bb:cc:dd:ee:ff")
+            mac_destiny: Destination MAC address
+
+        Returns:
+            bytes: The 20-byte frame header
+
+        Raises:
+            ValueError: If MAC addresses are invalid
+        """
+        key = (mac_source, mac_destiny)
+        header = self._header_cache.get(key)
+        if header is None:
+            mac_source_bytes = bytes.fromhex(mac_source.replace(":", ""))
+            mac_destiny_bytes = bytes.fromhex(mac_destiny.replace(":", ""))
+
+            if len(mac_source_bytes) != 6 or len(mac_destiny_bytes) != 6:
+                raise ValueError("MAC addresses must be 6 bytes")
+
+            header = mac_destiny_bytes + mac_source_bytes + self.HEADER_TAIL
+            self._header_cache[key] = header
+
+        return header
 
     def send_packet(
         self,
@@ -78,28 +159,18 @@ class PacketSender:
             Exception: If packet transmission fails
         """
         try:
-            # Validate and convert MAC addresses
-            mac_source_bytes = bytes.fromhex(mac_source.replace(":", ""))
-            mac_destiny_bytes = bytes.fromhex(mac_destiny.replace(":", ""))
-
-            if len(mac_source_bytes) != 6 or len(mac_destiny_bytes) != 6:
-                raise ValueError("MAC addresses must be 6 bytes")
-
-            # Construct packet
-            length_bytes = self.PAYLOAD_LENGTH.to_bytes(2, byteorder="big")
-
-            packet = (
-                mac_destiny_bytes
-                + mac_source_bytes
-                + length_bytes
-                + self.PADDING_BYTES
-                + self.CONSTANT_BYTES
-                + command_byte
-            )
-
-            # Send packet using Scapy
+            # Reuse the complete frame when this command was already built
+            # for this MAC pair (validates MACs on first use)
+            key = (mac_source, mac_destiny, command_byte)
+            packet = self._frame_cache.get(key)
+            if packet is None:
+                packet = self._get_frame_header(mac_source, mac_destiny) + command_byte
+                self._frame_cache[key] = packet
+
+            # Send packet using Scapy over the cached interface socket
             scapy_packet = Raw(load=packet)
-            sendp(scapy_packet, iface=interface, verbose=verbose)
+            sendp(scapy_packet, iface=interface, verbose=verbose,
+                  socket=self._get_l2_socket(interface))
 
             return True
 
@@ -67,6 +67,15 @@ class CommandsTab(ttk.Frame):
         self.drag_source = None
         self.drag_start_y = 0
 
+        # Drag and drop bindings are registered once at class level and shared
+        # by every row through a bindtag, instead of five bind() calls per row
+        self._row_cmd_names = {}  # {row_frame: cmd_name}
+        self.bind_class("CommandRow", "<Enter>", lambda e: e.widget.config(cursor="hand1"))
+        self.bind_class("CommandRow", "<Leave>", lambda e: e.widget.config(cursor=""))
+        self.bind_class("CommandRow", "<Button-1>", self._on_row_press)
+        self.bind_class("CommandRow", "<B1-Motion>", lambda e: self.do_drag(e, e.widget))
+        self.bind_class("CommandRow", "<ButtonRelease-1>", lambda e: self.end_drag(e, e.widget))
+
         # Setup UI
         self.setup_ui()
 
@@ -196,7 +205,10 @@ class CommandsTab(ttk.Frame):
         def toggle_all_commands():
             value = self.select_all_cb_var.get()
             for cmd_state in self.commands_state.values():
-                cmd_state["enabled"].set(value)
+                # Only write vars that actually change: every set() goes
+                # through Tcl and schedules a checkbutton redraw
+                if cmd_state["enabled"].get() != value:
+                    cmd_state["enabled"].set(value)
 
         self.select_all_cb_var = tk.BooleanVar(value=False)
         select_all_cb = tk.Checkbutton(
@@ -358,34 +370,73 @@ class CommandsTab(ttk.Frame):
         self.rebuild_command_table()
 
     def rebuild_command_table(self):
-        """Rebuild command table based on selected MC's command_configs and last_state."""
-        # Clear existing rows
-        for row_data in self.command_rows:
-            row_data["frame"].destroy()
-        self.command_rows.clear()
-        self.commands_state.clear()
+        """Update command table based on selected MC's command_configs and last_state.
 
-        # Get selected MC
-        if not self.selected_mc_mac:
-            return
+        Instead of destroying and recreating every row widget (expensive in Tk),
+        this diffs the current rows against the desired command list: existing
+        rows are kept and just refreshed, missing rows are created, removed rows
+        are destroyed, and ordering is fixed by repacking the frames.
+        """
+        # Get selected MC's desired command list
+        mc = self.state_manager.get_mc(self.selected_mc_mac) if self.selected_mc_mac else None
+        command_configs = mc.command_configs if mc and hasattr(mc, 'command_configs') else {}
+        last_state = mc.last_state if mc and hasattr(mc, 'last_state') else {}
+
+        current_rows = {row_data["cmd_name"]: row_data for row_data in self.command_rows}
+
+        # Destroy rows whose command no longer exists
+        for cmd_name, row_data in current_rows.items():
+            if cmd_name not in command_configs:
+                self._row_cmd_names.pop(row_data["frame"], None)
+                row_data["frame"].destroy()
+                self.commands_state.pop(cmd_name, None)
+
+        # Keep & refresh existing rows, create only the missing ones
+        new_rows = []
+        created_any = False
+        for cmd_name, cmd_config in command_configs.items():
+            if cmd_name in current_rows:
+                row_data = current_rows[cmd_name]
+                self.refresh_command_table_row(cmd_name, cmd_config, last_state)
+            else:
+                row_data = self.create_command_table_row(
+                    cmd_name, cmd_config, last_state.get(cmd_name, "")
+                )
+                created_any = True
+            new_rows.append(row_data)
 
-        mc = self.state_manager.get_mc(self.selected_mc_mac)
-        if not mc:
-            return
+        self.command_rows = new_rows
 
-        command_configs = mc.command_configs if hasattr(mc, 'command_configs') else {}
-        last_state = mc.last_state if hasattr(mc, 'last_state') else {}
+        # Repack frames so the visual order matches command_configs order
+        for row_data in self.command_rows:
+            row_data["frame"].pack_forget()
+            row_data["frame"].pack(fill="x")
 
-        # If no commands configured, show empty table
-        if not command_configs:
+        # Bind mousewheel scrolling only when new widgets were created
+        if created_any:
+            self.bind_mousewheel_to_table_widgets()
+
+    def refresh_command_table_row(self, cmd_name: str, cmd_config: Dict, last_state: Dict):
+        """Refresh an existing row's variables and button visuals without recreating widgets."""
+        cmd_state = self.commands_state.get(cmd_name)
+        if not cmd_state:
             return
 
-        # Create rows for each command
-        for cmd_name, cmd_config in command_configs.items():
-            self.create_command_table_row(cmd_name, cmd_config, last_state.get(cmd_name, ""))
+        cmd_state["enabled"].set(last_state.get(f"{cmd_name}_enabled", False))
+
+        state_value = last_state.get(cmd_name, "")
+        base_cmd = cmd_name.split('#')[0] if '#' in cmd_name else cmd_name
+        auto_commands = ["X_FF_Reset", "X_02_TestTrigger", "X_03_RO_Single"]
+        if base_cmd in auto_commands:
+            cmd_state["state"] = state_value if state_value else "ON"
+        else:
+            cmd_state["state"] = state_value if state_value else None
+            self.update_button_visuals(cmd_name, state_value)
 
-        # Bind mousewheel scrolling to all new widgets
-        self.bind_mousewheel_to_table_widgets()
+        if "repetitions" in cmd_state:
+            cmd_state["repetitions"].set(last_state.get(f"{cmd_name}_reps", 1))
+        if "delta_time" in cmd_state:
+            cmd_state["delta_time"].set(last_state.get(f"{cmd_name}_delta", 1.0))
 
     def bind_mousewheel_to_table_widgets(self):
         """Recursively bind mousewheel scrolling to all table widgets."""
@@ -408,7 +459,11 @@ class CommandsTab(ttk.Frame):
         bind_recursive(self.commands_table_frame)
 
     def create_command_table_row(self, cmd_name: str, cmd_config: Dict, last_state_value: str):
-        """Create a table row for a command."""
+        """Create a table row for a command.
+
+        Returns:
+            Dict: Row record {"frame": row_frame, "cmd_name": cmd_name}
+        """
         bg_color = "#f7f7f7"
         row_frame = tk.Frame(self.commands_table_frame, relief="ridge", borderwidth=1, bg=bg_color, height=35)
         row_frame.pack(fill="x")
@@ -611,19 +666,23 @@ class CommandsTab(ttk.Frame):
             )
             delay_spinbox.grid(row=0, column=col_offset, padx=2)
 
-        self.command_rows.append({"frame": row_frame, "cmd_name": cmd_name})
-
         # Setup drag and drop for this row
         self.setup_drag_and_drop(row_frame, cmd_name)
 
+        return {"frame": row_frame, "cmd_name": cmd_name}
+
     def setup_drag_and_drop(self, row_frame, cmd_name):
         """Configure drag and drop for a command row."""
-        # Bind events only to the frame (not to buttons or checkboxes)
-        row_frame.bind("<Enter>", lambda e: row_frame.config(cursor="hand1"))
-        row_frame.bind("<Leave>", lambda e: row_frame.config(cursor=""))
-        row_frame.bind("<Button-1>", lambda e: self.start_drag(e, row_frame, cmd_name))
-        row_frame.bind("<B1-Motion>", lambda e: self.do_drag(e, row_frame))
-        row_frame.bind("<ButtonRelease-1>", lambda e: self.end_drag(e, row_frame))
+        # Tag the frame so the shared class-level bindings apply to it
+        # (events only fire on the frame itself, not on buttons or checkboxes)
+        self._row_cmd_names[row_frame] = cmd_name
+        row_frame.bindtags(("CommandRow",) + row_frame.bindtags())
+
+    def _on_row_press(self, event):
+        """Route a row click to start_drag with the row's command name."""
+        cmd_name = self._row_cmd_names.get(event.widget)
+        if cmd_name is not None:
+            self.start_drag(event, event.widget, cmd_name)
 
     def start_drag(self, event, row_frame, cmd_name):
         """Start dragging a command row."""
@@ -728,12 +787,13 @@ class CommandsTab(ttk.Frame):
         item = self.command_rows.pop(source_idx)
         self.command_rows.insert(target_idx, item)
 
-        # Reorder in MC's command_configs
+        # Reorder in MC's command_configs (build the new dict in one pass
+        # instead of going through an intermediate list of tuples)
         if hasattr(mc, 'command_configs'):
-            configs_list = list(mc.command_configs.items())
-            config_item = configs_list.pop(source_idx)
-            configs_list.insert(target_idx, config_item)
-            mc.command_configs = dict(configs_list)
+            configs = mc.command_configs
+            new_order = [k for k in configs if k != source_cmd]
+            new_order.insert(target_idx, source_cmd)
+            mc.command_configs = {k: configs[k] for k in new_order}
 
             # Save to database
             self.state_manager._save_to_db()
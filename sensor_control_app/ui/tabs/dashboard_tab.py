@@ -59,7 +59,6 @@ class DashboardTab(ttk.Frame):
         self.on_refresh_callback = on_refresh_callback
 
         # UI state
-        self.mc_table_rows = []
         self.selected_pet_macros = {}  # {pet_num: [macro_names]}
 
         # PET command sending state
@@ -137,27 +136,23 @@ class DashboardTab(ttk.Frame):
         )
         section_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
-        # Table header
-        header_frame = ttk.Frame(section_frame)
-        header_frame.pack(fill="x", pady=5)
-
-        headers = ["Interface Network", "MAC Source", "MAC Destiny", "Interface Destiny", "Label"]
-        widths = [24, 28, 20, 20, 20]
-
-        for header, width in zip(headers, widths):
-            label = tk.Label(
-                header_frame,
-                text=header,
-                font=("Arial", 10, "bold"),
-                width=width,
-                relief="ridge",
-                bg="#e0e0e0"
-            )
-            label.pack(side="left", padx=1)
+        # Single Treeview instead of one Frame+Labels per row: the table is
+        # rendered by the native widget, so refreshes don't churn Tk widgets
+        columns = ("Interface Network", "MAC Source", "MAC Destiny", "Interface Destiny", "Label")
+        self.mc_table = ttk.Treeview(
+            section_frame,
+            columns=columns,
+            show="headings",
+            height=5
+        )
+        for col in columns:
+            self.mc_table.heading(col, text=col)
+            self.mc_table.column(col, width=150, anchor="center")
 
-        # Table container
-        self.mc_table_container = ttk.Frame(section_frame)
-        self.mc_table_container.pack(fill="both", expand=True)
+        # Light red background for available-but-unregistered MCs
+        self.mc_table.tag_configure("unregistered", background="#ffe0e0")
+
+        self.mc_table.pack(fill="both", expand=True)
 
     def create_registration_and_pet_section(self, parent):
         """Create registration form and PET associations side by side."""
@@ -492,9 +487,7 @@ class DashboardTab(ttk.Frame):
     def refresh_mc_table(self):
         """Refresh the microcontrollers table."""
         # Clear existing rows
-        for row in self.mc_table_rows:
-            row.destroy()
-        self.mc_table_rows.clear()
+        self.mc_table.delete(*self.mc_table.get_children())
 
         # Iterate over all available MCs (detected interfaces)
         for mac_source, interface_network in self.state_manager.mc_available.items():
@@ -503,74 +496,22 @@ class DashboardTab(ttk.Frame):
 
             if mc:
                 # MC is registered - show full info
-                self.create_mc_table_row_registered(mc, interface_network)
+                self.mc_table.insert("", "end", values=(
+                    interface_network,
+                    mc.mac_source,
+                    mc.mac_destiny,
+                    mc.interface_destiny,
+                    mc.label
+                ))
             else:
                 # MC is available but not registered
-                self.create_mc_table_row_unregistered(mac_source, interface_network)
-
-    def create_mc_table_row_registered(self, mc, interface_network: str):
-        """
-        Create a table row for a registered microcontroller.
-
-        Args:
-            mc: MicroController object
-            interface_network: Network interface name
-        """
-        row_frame = ttk.Frame(self.mc_table_container)
-        row_frame.pack(fill="x", pady=1)
-
-        widths = [20, 20, 20, 20, 20]
-        values = [
-            interface_network,
-            mc.mac_source,
-            mc.mac_destiny,
-            mc.interface_destiny,
-            mc.label
-        ]
-
-        for value, width in zip(values, widths):
-            label = tk.Label(
-                row_frame,
-                text=value,
-                width=width,
-                relief="ridge",
-                bg="white"
-            )
-            label.pack(side="left", padx=1)
-
-        self.mc_table_rows.append(row_frame)
-
-    def create_mc_table_row_unregistered(self, mac_source: str, interface_network: str):
-        """
-        Create a table row for an unregistered (available) microcontroller.
-
-        Args:
-            mac_source: Source MAC address
-            interface_network: Network interface name
-        """
-        row_frame = ttk.Frame(self.mc_table_container)
-        row_frame.pack(fill="x", pady=1)
-
-        widths = [20, 20, 20, 20, 20]
-        values = [
-            interface_network,
-            mac_source,
-            "Not registered",
-            "N/A",
-            "N/A"
-        ]
-
-        for value, width in zip(values, widths):
-            label = tk.Label(
-                row_frame,
-                text=value,
-                width=width,
-                relief="ridge",
-                bg="#ffe0e0"  # Light red background for unregistered
-            )
-            label.pack(side="left", padx=1)
-
-        self.mc_table_rows.append(row_frame)
+                self.mc_table.insert("", "end", values=(
+                    interface_network,
+                    mac_source,
+                    "Not registered",
+                    "N/A",
+                    "N/A"
+                ), tags=("unregistered",))
 
 
     def setup_pet_tooltip(self, button, pet_num: int):